@@ -4,9 +4,10 @@ Thermal Water Wellness Center Management System
 """
 
 import sys
-import traceback
+import logging
 from database.db_manager import DatabaseManagement
-from gui.main_window import MainWindow
+
+logger = logging.getLogger(__name__)
 
 
 def main():
@@ -21,13 +22,14 @@ def main():
         print("Database initialized successfully!")
         
         # Create and run main window
+        # Imported here so the Tk widget tree only loads once the DB is ready
+        from gui.main_window import MainWindow
         print("Starting Panda Spa application...")
         app = MainWindow(db_manager)
         app.run()
         
     except Exception as e:
-        print(f"Error starting application: {e}")
-        traceback.print_exc()
+        logger.exception("Error starting application: %s", e)
         if db_manager:
             db_manager.close()
         sys.exit(1)
@@ -1,10 +1,25 @@
 """
 Database package for Panda Spa application.
 Contains database management and ORM base classes.
-"""
 
-from .base import Base
-from .db_manager import DatabaseManagement
+Submodules are loaded on first attribute access, so importing the package
+does not pull in SQLAlchemy until Base or DatabaseManagement is needed.
+"""
 
 __all__ = ['Base', 'DatabaseManagement']
 
+
+def __getattr__(name):
+    """Lazily import the package's public classes."""
+    if name == 'Base':
+        from .base import Base
+        return Base
+    if name == 'DatabaseManagement':
+        from .db_manager import DatabaseManagement
+        return DatabaseManagement
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazily loaded names alongside the module's own attributes."""
+    return sorted(set(globals()) | set(__all__))
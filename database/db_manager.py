@@ -4,16 +4,194 @@ Handles all SQLite database interactions using SQLAlchemy ORM.
 """
 
 import os
-import shutil
-from typing import Callable, TypeVar, Optional, Type, Any, Dict, List
-from sqlalchemy import create_engine, Engine, text, inspect, select, func
-from sqlalchemy.orm import sessionmaker, Session
+import importlib
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, TypeVar, Optional, Type, Any, Dict, List, Iterator, Iterable, Sequence, Union
+from sqlalchemy import create_engine, Engine, event, text, inspect, select, update, delete, func, bindparam, or_
+from sqlalchemy.orm import sessionmaker, scoped_session, Session, MANYTOONE
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
 
 from .base import Base
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar('T')
 
+# PRAGMAs applied to every new SQLite connection.
+# WAL lets readers proceed while a writer commits, and synchronous=NORMAL
+# is safe under WAL while needing only one fsync per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+# Rows fetched per batch when streaming query results
+STREAM_BATCH_SIZE = 500
+
+# Primary keys bound per DELETE ... WHERE id IN (...) statement, kept well
+# below SQLite's limit on bound variables per statement
+DELETE_BATCH_SIZE = 500
+
+# Primary keys bound per SELECT ... WHERE id IN (...) statement in get_by_ids()
+FETCH_BATCH_SIZE = 500
+
+# Shapes of statement that _filter_statement can build
+QUERY_ROWS = "rows"
+QUERY_FIRST = "first"
+QUERY_COUNT = "count"
+QUERY_EXISTS = "exists"
+QUERY_DELETE = "delete"
+
+# Set once the models package has been imported and registered with Base
+_models_registered = False
+
+
+def _register_models() -> None:
+    """Import the models package once so all tables are registered with Base."""
+    global _models_registered
+    if _models_registered:
+        return
+    try:
+        importlib.import_module("models")
+    except ImportError:
+        return  # Models not created yet
+    _models_registered = True
+
+
+@lru_cache(maxsize=None)
+def _column_keys(model_class: Type[Base]) -> tuple:
+    """Get the column names of a model's table (cached per class)."""
+    return tuple(model_class.__table__.columns.keys())
+
+
+@lru_cache(maxsize=256)
+def _filter_statement(model_class: Type[Base], filter_shape: tuple, query: str):
+    """
+    Build (once per model, filter shape and query kind) a filtered statement.
+    
+    Filter values are left as bound parameters named ``filter_<key>`` so the
+    same statement object is reused for every call with the same filter keys.
+    
+    Args:
+        model_class: The model class to query
+        filter_shape: Tuple of (field name, value is None) pairs
+        query: One of QUERY_ROWS, QUERY_FIRST, QUERY_COUNT, QUERY_EXISTS
+    """
+    criteria = _filter_criteria(model_class, filter_shape)
+    if query == QUERY_COUNT:
+        return select(func.count()).select_from(model_class).where(*criteria)
+    statement = select(model_class).where(*criteria)
+    if query == QUERY_FIRST:
+        return statement.limit(1)
+    if query == QUERY_EXISTS:
+        return select(statement.exists())
+    return statement
+
+
+def _filter_criteria(model_class: Type[Base], filter_shape: tuple) -> list:
+    """Build equality criteria bound to ``filter_<key>`` parameters (IS NULL for None)."""
+    return [
+        getattr(model_class, key).is_(None) if is_none
+        else getattr(model_class, key) == bindparam(f"filter_{key}")
+        for key, is_none in filter_shape
+    ]
+
+
+@lru_cache(maxsize=256)
+def _ids_statement(model_class: Type[Base], query: str):
+    """
+    Build (once per model and query kind) a statement over rows whose id is in ``ids``.
+    
+    ``ids`` is an expanding bound parameter, so one statement serves every batch.
+    
+    Args:
+        model_class: The model class to query
+        query: QUERY_ROWS to select the rows or QUERY_DELETE to delete them
+    """
+    criterion = model_class.id.in_(bindparam("ids", expanding=True))
+    if query == QUERY_DELETE:
+        return delete(model_class).where(criterion)
+    return select(model_class).where(criterion)
+
+
+@lru_cache(maxsize=256)
+def _range_statement(model_class: Type[Base], field: str, filter_shape: tuple):
+    """
+    Build (once per model, range field and filter shape) a range statement.
+    
+    Bounds are bound as ``range_start``/``range_end`` and rows come back
+    ordered by the range field.
+    """
+    column = getattr(model_class, field)
+    criteria = _filter_criteria(model_class, filter_shape)
+    criteria.append(column.between(bindparam("range_start"), bindparam("range_end")))
+    return select(model_class).where(*criteria).order_by(column)
+
+
+@lru_cache(maxsize=256)
+def _ordered_statement(model_class: Type[Base], fields: tuple, descending: bool):
+    """Build (once per model, fields and direction) a select ordered by fields, ties by primary key."""
+    columns = [getattr(model_class, field) for field in fields]
+    return select(model_class).order_by(
+        *(column.desc() if descending else column for column in columns),
+        *inspect(model_class).primary_key
+    )
+
+
+@lru_cache(maxsize=256)
+def _columns_statement(model_class: Type[Base], fields: tuple):
+    """Build (once per model and field tuple) a select of just those columns, ordered by primary key."""
+    columns = [getattr(model_class, field) for field in fields]
+    return select(*columns).order_by(*inspect(model_class).primary_key)
+
+
+@lru_cache(maxsize=256)
+def _search_statement(model_class: Type[Base], fields: tuple, filter_shape: tuple):
+    """
+    Build (once per model, searched fields and filter shape) a text search statement.
+    
+    The LIKE pattern is bound as ``search_pattern`` and rows come back
+    ordered by primary key.
+    """
+    criteria = _filter_criteria(model_class, filter_shape)
+    criteria.append(or_(*(
+        getattr(model_class, field).ilike(bindparam("search_pattern"), escape="\\")
+        for field in fields
+    )))
+    return select(model_class).where(*criteria).order_by(*inspect(model_class).primary_key)
+
+
+def _filtered(model_class: Type[Base], filters: Dict[str, Any], query: str) -> tuple:
+    """
+    Get a cached filtered statement and the parameters to execute it with.
+    
+    Returns:
+        Tuple of (statement, parameter dict)
+    """
+    shape = tuple(sorted((key, value is None) for key, value in filters.items()))
+    params = {f"filter_{key}": value for key, value in filters.items() if value is not None}
+    return _filter_statement(model_class, shape, query), params
+
+
+@lru_cache(maxsize=None)
+def _has_dependent_rows(model_class: Type[Base]) -> bool:
+    """
+    Check whether deleting rows of a model must also touch other tables.
+    
+    Models with one-to-many or many-to-many relationships need the ORM to
+    clear association rows or child foreign keys; models that only hold
+    many-to-one references can be deleted with a plain DELETE statement.
+    """
+    return any(rel.direction is not MANYTOONE for rel in inspect(model_class).relationships)
+
 
 class DatabaseManagement:
     """
@@ -31,6 +209,8 @@ class DatabaseManagement:
         self.db_path = db_path
         self.engine: Optional[Engine] = None
         self.session_factory: Optional[sessionmaker] = None
+        self._scoped_session: Optional[scoped_session] = None
+        self._table_names: Optional[List[str]] = None  # Cached by get_database_info
         self._initialized = False
     
     def initialize_database(self) -> None:
@@ -41,26 +221,67 @@ class DatabaseManagement:
         if self._initialized:
             return
         
+        # Keep a small pool of open connections so CRUD calls reuse the
+        # same file handle instead of reopening the database each time.
+        # In-memory databases keep SQLAlchemy's default per-thread pool.
+        pool_options = {}
+        if self.db_path != ":memory:":
+            pool_options = {
+                "poolclass": QueuePool,
+                "pool_size": 1,
+                "max_overflow": 4,
+                "pool_recycle": 3600,
+            }
+        
         # Create SQLite engine with connection pooling
         # check_same_thread=False allows multi-threaded access if needed
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
             echo=False,  # Set to True for SQL query logging
-            connect_args={"check_same_thread": False}
+            connect_args={"check_same_thread": False},
+            **pool_options
         )
+        event.listen(self.engine, "connect", self._configure_connection)
+        # The pysqlite driver only issues BEGIN before INSERT/UPDATE/DELETE,
+        # so read-only calls (get_by_id, find, count, ...) already run without
+        # a BEGIN/COMMIT pair. Installing an explicit "begin" hook would add one.
         
         # Create session factory
+        # expire_on_commit=False keeps attribute values loaded after commit,
+        # so returned objects stay usable once their session is closed
         self.session_factory = sessionmaker(
             bind=self.engine,
             autocommit=False,
-            autoflush=False
+            autoflush=False,
+            expire_on_commit=False
         )
         
+        # Thread-local session reused by the convenience CRUD methods
+        self._scoped_session = scoped_session(self.session_factory)
+        
         # Create all tables
         self.create_tables()
         
         self._initialized = True
     
+    def _configure_connection(self, dbapi_connection, connection_record) -> None:
+        """
+        Apply SQLite performance PRAGMAs to a freshly opened connection.
+        
+        Args:
+            dbapi_connection: Raw sqlite3 connection
+            connection_record: Pool connection record (unused)
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            # WAL is not supported for in-memory databases
+            if self.db_path != ":memory:":
+                cursor.execute("PRAGMA journal_mode=WAL")
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+    
     def create_tables(self) -> None:
         """
         Create all database tables if they don't exist.
@@ -69,14 +290,11 @@ class DatabaseManagement:
         if self.engine is None:
             raise RuntimeError("Database not initialized. Call initialize_database() first.")
         
-        # Import all models here to ensure they're registered with Base
-        # This ensures all model tables are created
-        try:
-            from models import Customer, Service, Appointment, Supplier, FinancialRecord, CustomerPreference, Extra, FeelingServiceMapping  # Import models to register with Base
-        except ImportError:
-            pass  # Models not created yet
+        # Ensure all model tables are registered with Base before creating them
+        _register_models()
         
         Base.metadata.create_all(bind=self.engine)
+        self._table_names = None
     
     def drop_tables(self) -> None:
         """
@@ -86,6 +304,7 @@ class DatabaseManagement:
             raise RuntimeError("Database not initialized. Call initialize_database() first.")
         
         Base.metadata.drop_all(bind=self.engine)
+        self._table_names = None
     
     def get_session(self) -> Session:
         """
@@ -96,22 +315,43 @@ class DatabaseManagement:
             
         Note:
             Caller is responsible for closing the session.
-            Consider using UnitOfWork for automatic session management.
+            Consider using unit_of_work() for automatic session management.
         """
         if self.session_factory is None:
             raise RuntimeError("Database not initialized. Call initialize_database() first.")
         
         return self.session_factory()
     
+    def _session(self) -> Session:
+        """
+        Get the thread-local session used by the convenience methods.
+        
+        Closing it releases its connection back to the pool and detaches
+        loaded objects, but the session itself is reused on the next call.
+        Query functions passed to execute_query/execute_transaction must only
+        use the session they are given.
+        
+        Returns:
+            SQLAlchemy Session object
+        """
+        if self._scoped_session is None:
+            raise RuntimeError("Database not initialized. Call initialize_database() first.")
+        
+        return self._scoped_session()
+    
     def close(self) -> None:
         """
         Close all database connections and cleanup resources.
         Should be called at application shutdown.
         """
         if self.engine:
+            if self._scoped_session is not None:
+                self._scoped_session.remove()
+                self._scoped_session = None
             self.engine.dispose()
             self.engine = None
             self.session_factory = None
+            self._table_names = None
             self._initialized = False
     
     def execute_query(self, query_func: Callable[[Session], T]) -> T:
@@ -128,7 +368,7 @@ class DatabaseManagement:
             result = db_manager.execute_query(lambda session: 
                 session.query(Customer).all())
         """
-        session = self.get_session()
+        session = self._session()
         try:
             result = query_func(session)
             return result
@@ -149,22 +389,55 @@ class DatabaseManagement:
             success = db_manager.execute_transaction(lambda session:
                 session.add(new_customer))
         """
-        session = self.get_session()
+        session = self._session()
         try:
             transaction_func(session)
             session.commit()
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Transaction failed: {e}")
+            logger.error("Transaction failed: %s", e)
             return False
         finally:
             session.close()
     
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Session]:
+        """
+        Provide one session and transaction for a batch of operations.
+        
+        Commits when the block exits normally and rolls back if it raises.
+        Pass the yielded session to the convenience CRUD methods via their
+        ``session`` keyword so they share one connection and transaction.
+        Inside a unit of work those methods flush instead of committing,
+        and database errors propagate so the whole batch is rolled back.
+        
+        Yields:
+            SQLAlchemy Session object
+            
+        Example:
+            with db_manager.unit_of_work() as session:
+                customer = db_manager.get_by_id(Customer, 1, session=session)
+                visits = db_manager.count(Appointment, session=session, customer_id=1)
+        """
+        session = self.get_session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
     def backup_database(self, backup_path: str) -> None:
         """
         Create a backup of the database file.
         
+        Uses SQLite's online backup API, which copies a consistent snapshot
+        (including changes still in the WAL file) in chunks of pages rather
+        than copying the raw database file.
+        
         Args:
             backup_path: Path where backup should be saved
         """
@@ -173,10 +446,26 @@ class DatabaseManagement:
         
         # Ensure backup directory exists
         backup_dir = os.path.dirname(backup_path)
-        if backup_dir and not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
+        if backup_dir:
+            os.makedirs(backup_dir, exist_ok=True)
         
-        shutil.copy2(self.db_path, backup_path)
+        import sqlite3
+        target = sqlite3.connect(backup_path)
+        try:
+            if self.engine is not None:
+                raw_connection = self.engine.raw_connection()
+                try:
+                    raw_connection.driver_connection.backup(target, pages=1024)
+                finally:
+                    raw_connection.close()
+            else:
+                source = sqlite3.connect(self.db_path)
+                try:
+                    source.backup(target, pages=1024)
+                finally:
+                    source.close()
+        finally:
+            target.close()
     
     def restore_database(self, backup_path: str) -> None:
         """
@@ -195,6 +484,7 @@ class DatabaseManagement:
         self.close()
         
         # Copy backup to database path
+        import shutil
         shutil.copy2(backup_path, self.db_path)
         
         # Reinitialize
@@ -209,30 +499,39 @@ class DatabaseManagement:
         """
         info = {
             "db_path": self.db_path,
-            "exists": os.path.exists(self.db_path),
+            "exists": False,
             "initialized": self._initialized
         }
         
-        if os.path.exists(self.db_path):
-            info["size_bytes"] = os.path.getsize(self.db_path)
+        # One stat() call gives both existence and size
+        try:
+            stat_result = os.stat(self.db_path)
+        except FileNotFoundError:
+            pass
+        else:
+            info["exists"] = True
+            info["size_bytes"] = stat_result.st_size
             info["size_mb"] = round(info["size_bytes"] / (1024 * 1024), 2)
         
         if self.engine:
             # Get table names using SQLAlchemy 2.0 inspect API
-            inspector = inspect(self.engine)
-            info["tables"] = inspector.get_table_names()
+            # (cached until tables are created or dropped)
+            if self._table_names is None:
+                self._table_names = inspect(self.engine).get_table_names()
+            info["tables"] = list(self._table_names)
             info["table_count"] = len(info["tables"])
         
         return info
     
     # ==================== Convenience CRUD Methods ====================
     
-    def save(self, obj: Base) -> bool:
+    def save(self, obj: Base, session: Optional[Session] = None) -> bool:
         """
         Save (add) a single object to the database and commit.
         
         Args:
             obj: SQLAlchemy model instance to save
+            session: Optional session from unit_of_work() to run in
             
         Returns:
             True if saved successfully, False otherwise
@@ -241,29 +540,31 @@ class DatabaseManagement:
             customer = Customer(name="Bamboo Bear", species="Bear")
             success = db_manager.save(customer)
         """
-        session = self.get_session()
+        if session is not None:
+            session.add(obj)
+            session.flush()
+            return True
+        
+        session = self._session()
         try:
             session.add(obj)
-            session.flush()  # Flush to get ID
-            obj_id = obj.id  # Get ID while still in session
             session.commit()
-            # Update object's __dict__ to preserve ID after detach
-            if obj_id is not None:
-                obj.__dict__['id'] = obj_id
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Save failed: {e}")
+            logger.error("Save failed: %s", e)
             return False
         finally:
             session.close()
     
-    def create(self, model_class: Type[Base], **kwargs) -> Optional[Base]:
+    def create(self, model_class: Type[Base], *, session: Optional[Session] = None,
+               **kwargs) -> Optional[Base]:
         """
         Create a new instance of a model and save it to the database.
         
         Args:
             model_class: The model class to instantiate
+            session: Optional session from unit_of_work() to run in
             **kwargs: Field values for the new instance
             
         Returns:
@@ -272,35 +573,36 @@ class DatabaseManagement:
         Example:
             customer = db_manager.create(Customer, name="Bamboo Bear", species="Bear")
         """
+        if session is not None:
+            obj = model_class(**kwargs)
+            session.add(obj)
+            session.flush()
+            return obj
+        
         try:
             obj = model_class(**kwargs)
-            session = self.get_session()
+            session = self._session()
             try:
                 session.add(obj)
-                session.flush()  # Flush to get ID
-                # Get all attribute values while in session
-                obj_id = obj.id
-                obj_dict = {key: getattr(obj, key) for key in obj.__table__.columns.keys()}
                 session.commit()
-                # Update object's __dict__ to preserve values after detach
-                obj.__dict__.update(obj_dict)
                 return obj
             except SQLAlchemyError as e:
                 session.rollback()
-                print(f"Create failed: {e}")
+                logger.error("Create failed: %s", e)
                 return None
             finally:
                 session.close()
         except Exception as e:
-            print(f"Failed to create {model_class.__name__}: {e}")
+            logger.error("Failed to create %s: %s", model_class.__name__, e)
             return None
     
-    def update(self, obj: Base, **kwargs) -> bool:
+    def update(self, obj: Base, *, session: Optional[Session] = None, **kwargs) -> bool:
         """
         Update an existing object's attributes and save changes.
         
         Args:
             obj: The object to update
+            session: Optional session from unit_of_work() to run in
             **kwargs: Field names and new values to update
             
         Returns:
@@ -309,31 +611,69 @@ class DatabaseManagement:
         Example:
             success = db_manager.update(customer, name="Updated Name", contact_info="new@email.com")
         """
-        session = self.get_session()
+        if session is not None:
+            self._apply_update(session, obj, kwargs)
+            session.flush()
+            self._mirror_values(obj, kwargs)
+            return True
+        
+        session = self._session()
         try:
-            # Merge object into session
-            merged_obj = session.merge(obj)
-            
-            # Update attributes
-            for key, value in kwargs.items():
-                if hasattr(merged_obj, key):
-                    setattr(merged_obj, key, value)
-                else:
-                    raise AttributeError(f"{merged_obj.__class__.__name__} has no attribute '{key}'")
-            
+            self._apply_update(session, obj, kwargs)
             session.commit()
-            # Update original object's attributes
-            for key, value in kwargs.items():
-                if hasattr(obj, key):
-                    setattr(obj, key, value)
+            self._mirror_values(obj, kwargs)
             return True
         except (SQLAlchemyError, AttributeError) as e:
             session.rollback()
-            print(f"Update failed: {e}")
+            logger.error("Update failed: %s", e)
             return False
         finally:
             session.close()
     
+    def _apply_update(self, session: Session, obj: Base, values: Dict[str, Any]) -> None:
+        """
+        Write new attribute values for an object's row.
+        
+        Plain column values go out as a single UPDATE ... WHERE id = ?;
+        anything else (e.g. relationships) falls back to merging the object
+        and setting attributes through the ORM.
+        
+        Args:
+            session: Session to run in
+            obj: The object to update
+            values: Field names and new values
+        """
+        model_class = type(obj)
+        for key in values:
+            if not hasattr(obj, key):
+                raise AttributeError(f"{model_class.__name__} has no attribute '{key}'")
+        
+        if values.keys() <= set(_column_keys(model_class)):
+            session.execute(
+                update(model_class).where(model_class.id == obj.id).values(**values)
+            )
+            return
+        
+        # Merge object into session
+        merged_obj = session.merge(obj)
+        for key, value in values.items():
+            setattr(merged_obj, key, value)
+    
+    def _mirror_values(self, obj: Base, values: Dict[str, Any]) -> None:
+        """
+        Copy saved values onto the caller's object without marking it dirty.
+        
+        Args:
+            obj: The object that was updated
+            values: Field names and new values
+        """
+        column_keys = _column_keys(type(obj))
+        for key, value in values.items():
+            if key in column_keys:
+                set_committed_value(obj, key, value)
+            else:
+                setattr(obj, key, value)
+    
     def delete(self, obj: Base) -> bool:
         """
         Delete an object from the database.
@@ -348,16 +688,46 @@ class DatabaseManagement:
             success = db_manager.delete(customer)
         """
         return self.execute_transaction(
-            lambda session: session.delete(session.merge(obj))
+            lambda session: self._delete_by_ids(session, type(obj), [obj.id])
         )
     
-    def get_by_id(self, model_class: Type[Base], id: int) -> Optional[Base]:
+    def _delete_by_ids(self, session: Session, model_class: Type[Base], ids: List[int]) -> None:
+        """
+        Delete rows of one model by primary key.
+        
+        Issues one DELETE ... WHERE id IN (...) per DELETE_BATCH_SIZE ids
+        when no other table depends on the rows; otherwise loads them with
+        one SELECT per batch and lets the ORM delete them so relationship
+        bookkeeping still happens.
+        
+        Args:
+            session: Session to run in
+            model_class: The model class to delete from
+            ids: Primary keys of the rows to delete
+        """
+        dependent = _has_dependent_rows(model_class)
+        statement = _ids_statement(model_class, QUERY_ROWS if dependent else QUERY_DELETE)
+        for start in range(0, len(ids), DELETE_BATCH_SIZE):
+            params = {"ids": ids[start:start + DELETE_BATCH_SIZE]}
+            if dependent:
+                for obj in session.scalars(statement, params):
+                    session.delete(obj)
+            else:
+                session.execute(statement, params)
+    
+    def get_by_id(self, model_class: Type[Base], id: int,
+                  session: Optional[Session] = None) -> Optional[Base]:
         """
         Get a single object by its ID.
         
+        Session.get() checks the session's identity map first, so repeated
+        lookups of the same row within one unit_of_work() session cost a
+        single SELECT; later calls are served without touching the database.
+        
         Args:
             model_class: The model class to query
             id: The ID of the object to retrieve
+            session: Optional session from unit_of_work() to run in
             
         Returns:
             The object if found, None otherwise
@@ -365,33 +735,180 @@ class DatabaseManagement:
         Example:
             customer = db_manager.get_by_id(Customer, 1)
         """
-        return self.execute_query(
-            lambda session: session.get(model_class, id)
-        )
+        if session is not None:
+            return session.get(model_class, id)
+        with self._session() as session:
+            return session.get(model_class, id)
+    
+    def get_by_ids(self, model_class: Type[Base], ids: Iterable[int],
+                   session: Optional[Session] = None) -> Dict[int, Base]:
+        """
+        Get several objects by ID with one SELECT ... WHERE id IN (...) per batch.
+        
+        Args:
+            model_class: The model class to query
+            ids: IDs of the objects to retrieve (duplicates are fetched once)
+            session: Optional session from unit_of_work() to run in
+            
+        Returns:
+            Dictionary mapping ID to object; missing IDs are left out
+            
+        Example:
+            customers = db_manager.get_by_ids(Customer, {a.customer_id for a in appointments})
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        statement = _ids_statement(model_class, QUERY_ROWS)
+        
+        def fetch(session: Session) -> Dict[int, Base]:
+            found = {}
+            for start in range(0, len(unique_ids), FETCH_BATCH_SIZE):
+                params = {"ids": unique_ids[start:start + FETCH_BATCH_SIZE]}
+                for obj in session.scalars(statement, params):
+                    found[obj.id] = obj
+            return found
+        
+        if session is not None:
+            return fetch(session)
+        with self._session() as session:
+            return fetch(session)
     
-    def get_all(self, model_class: Type[Base]) -> List[Base]:
+    def get_all(self, model_class: Type[Base],
+                session: Optional[Session] = None, *,
+                order_by: Optional[Union[str, Sequence[str]]] = None,
+                descending: bool = False) -> List[Base]:
         """
         Get all instances of a model class.
         
         Args:
             model_class: The model class to query
+            session: Optional session from unit_of_work() to run in
+            order_by: Optional field name, or sequence of names, to sort by in SQL
+                (ties keep primary key order)
+            descending: Sort order_by from highest to lowest
             
         Returns:
             List of all instances
             
         Example:
             all_customers = db_manager.get_all(Customer)
+            newest_first = db_manager.get_all(Appointment, order_by="appointment_datetime",
+                                              descending=True)
+            by_feeling = db_manager.get_all(FeelingServiceMapping, order_by=("feeling", "priority"))
         """
-        return self.execute_query(
-            lambda session: list(session.scalars(select(model_class)).all())
-        )
+        if session is not None:
+            return list(self.iter_all(model_class, session=session,
+                                      order_by=order_by, descending=descending))
+        with self._session() as session:
+            return list(self.iter_all(model_class, session=session,
+                                      order_by=order_by, descending=descending))
+    
+    def get_columns(self, model_class: Type[Base], fields: Iterable[str],
+                    session: Optional[Session] = None) -> List[tuple]:
+        """
+        Get selected column values for every row of a model, without loading objects.
+        
+        Args:
+            model_class: The model class to query
+            fields: Names of the columns to fetch, in tuple order
+            session: Optional session from unit_of_work() to run in
+            
+        Returns:
+            List of value tuples ordered by primary key
+            
+        Example:
+            names = db_manager.get_columns(Customer, ("id", "name"))
+        """
+        statement = _columns_statement(model_class, tuple(fields))
+        if session is not None:
+            return [tuple(row) for row in session.execute(statement)]
+        with self._session() as session:
+            return [tuple(row) for row in session.execute(statement)]
+    
+    def iter_all(self, model_class: Type[Base],
+                 session: Optional[Session] = None, *,
+                 order_by: Optional[Union[str, Sequence[str]]] = None,
+                 descending: bool = False) -> Iterator[Base]:
+        """
+        Stream all instances of a model class in batches.
+        
+        Rows are fetched STREAM_BATCH_SIZE at a time, so callers can start
+        using results before the whole table has been loaded.
+        
+        Args:
+            model_class: The model class to query
+            session: Optional session from unit_of_work() to run in
+            order_by: Optional field name, or sequence of names, to sort by in SQL
+                (ties keep primary key order)
+            descending: Sort order_by from highest to lowest
+            
+        Yields:
+            Model instances
+            
+        Example:
+            for customer in db_manager.iter_all(Customer):
+                print(customer.name)
+        """
+        if order_by is not None:
+            fields = (order_by,) if isinstance(order_by, str) else tuple(order_by)
+            return self._stream(_ordered_statement(model_class, fields, descending), session, {})
+        statement, params = _filtered(model_class, {}, QUERY_ROWS)
+        return self._stream(statement, session, params)
+    
+    def iter_find(self, model_class: Type[Base], *, session: Optional[Session] = None,
+                  **filters) -> Iterator[Base]:
+        """
+        Stream objects matching the given filters in batches.
+        
+        Args:
+            model_class: The model class to query
+            session: Optional session from unit_of_work() to run in
+            **filters: Field names and values to filter by
+            
+        Yields:
+            Matching model instances
+            
+        Example:
+            for bear in db_manager.iter_find(Customer, species="Bear"):
+                print(bear.name)
+        """
+        statement, params = _filtered(model_class, filters, QUERY_ROWS)
+        return self._stream(statement, session, params)
     
-    def find(self, model_class: Type[Base], **filters) -> List[Base]:
+    def _stream(self, statement, session: Optional[Session] = None,
+                params: Optional[Dict[str, Any]] = None) -> Iterator[Base]:
+        """
+        Yield ORM results of a select statement using yield_per batching.
+        
+        Without a session, a dedicated session is opened and closed when the
+        iteration finishes, so other CRUD calls made while iterating are safe.
+        
+        Args:
+            statement: Select statement to execute
+            session: Optional session to run in
+            params: Optional bound parameter values
+            
+        Yields:
+            Model instances
+        """
+        options = {"yield_per": STREAM_BATCH_SIZE}
+        if session is not None:
+            yield from session.scalars(statement, params, execution_options=options)
+            return
+        
+        session = self.get_session()
+        try:
+            yield from session.scalars(statement, params, execution_options=options)
+        finally:
+            session.close()
+    
+    def find(self, model_class: Type[Base], *, session: Optional[Session] = None,
+             **filters) -> List[Base]:
         """
         Find objects matching the given filters.
         
         Args:
             model_class: The model class to query
+            session: Optional session from unit_of_work() to run in
             **filters: Field names and values to filter by
             
         Returns:
@@ -401,20 +918,84 @@ class DatabaseManagement:
             bears = db_manager.find(Customer, species="Bear")
             active_customers = db_manager.find(Customer, is_active=True)
         """
-        return self.execute_query(
-            lambda session: list(
-                session.scalars(
-                    select(model_class).filter_by(**filters)
-                ).all()
-            )
-        )
+        if session is not None:
+            return list(self.iter_find(model_class, session=session, **filters))
+        with self._session() as session:
+            return list(self.iter_find(model_class, session=session, **filters))
+    
+    def find_in_range(self, model_class: Type[Base], field: str, start: Any, end: Any, *,
+                      session: Optional[Session] = None, **filters) -> List[Base]:
+        """
+        Find objects whose field lies between start and end (inclusive).
+        
+        The range and any equality filters are applied in SQL, so only
+        matching rows are loaded.
+        
+        Args:
+            model_class: The model class to query
+            field: Name of the column to range over
+            start: Lower bound (inclusive)
+            end: Upper bound (inclusive)
+            session: Optional session from unit_of_work() to run in
+            **filters: Field names and values to filter by
+            
+        Returns:
+            List of matching instances ordered by field
+            
+        Example:
+            todays = db_manager.find_in_range(Appointment, "appointment_datetime",
+                                              day_start, day_end, status="scheduled")
+        """
+        shape = tuple(sorted((key, value is None) for key, value in filters.items()))
+        params = {f"filter_{key}": value for key, value in filters.items() if value is not None}
+        params["range_start"] = start
+        params["range_end"] = end
+        statement = _range_statement(model_class, field, shape)
+        if session is not None:
+            return list(self._stream(statement, session, params))
+        with self._session() as session:
+            return list(self._stream(statement, session, params))
     
-    def find_one(self, model_class: Type[Base], **filters) -> Optional[Base]:
+    def search(self, model_class: Type[Base], fields: Iterable[str], search_text: str, *,
+               session: Optional[Session] = None, **filters) -> List[Base]:
+        """
+        Find objects where any of the given fields contains the search text.
+        
+        Matching is case-insensitive and runs in SQL as a LIKE over each
+        field, combined with any equality filters.
+        
+        Args:
+            model_class: The model class to query
+            fields: Names of the text columns to search
+            search_text: Text to look for; LIKE wildcards in it match literally
+            session: Optional session from unit_of_work() to run in
+            **filters: Field names and values to filter by
+            
+        Returns:
+            List of matching instances ordered by primary key
+            
+        Example:
+            foxes = db_manager.search(Customer, ("name", "contact_info"), "den",
+                                      species="Fox")
+        """
+        escaped = search_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        shape = tuple(sorted((key, value is None) for key, value in filters.items()))
+        params = {f"filter_{key}": value for key, value in filters.items() if value is not None}
+        params["search_pattern"] = f"%{escaped}%"
+        statement = _search_statement(model_class, tuple(fields), shape)
+        if session is not None:
+            return list(self._stream(statement, session, params))
+        with self._session() as session:
+            return list(self._stream(statement, session, params))
+    
+    def find_one(self, model_class: Type[Base], *, session: Optional[Session] = None,
+                 **filters) -> Optional[Base]:
         """
         Find a single object matching the given filters.
         
         Args:
             model_class: The model class to query
+            session: Optional session from unit_of_work() to run in
             **filters: Field names and values to filter by
             
         Returns:
@@ -423,18 +1004,20 @@ class DatabaseManagement:
         Example:
             customer = db_manager.find_one(Customer, name="Bamboo Bear")
         """
-        return self.execute_query(
-            lambda session: session.scalars(
-                select(model_class).filter_by(**filters).limit(1)
-            ).first()
-        )
+        statement, params = _filtered(model_class, filters, QUERY_FIRST)
+        if session is not None:
+            return session.scalars(statement, params).first()
+        with self._session() as session:
+            return session.scalars(statement, params).first()
     
-    def count(self, model_class: Type[Base], **filters) -> int:
+    def count(self, model_class: Type[Base], *, session: Optional[Session] = None,
+              **filters) -> int:
         """
         Count objects matching the given filters (or all if no filters).
         
         Args:
             model_class: The model class to query
+            session: Optional session from unit_of_work() to run in
             **filters: Optional field names and values to filter by
             
         Returns:
@@ -444,18 +1027,21 @@ class DatabaseManagement:
             total = db_manager.count(Customer)
             bear_count = db_manager.count(Customer, species="Bear")
         """
-        return self.execute_query(
-            lambda session: session.scalar(
-                select(func.count()).select_from(model_class).filter_by(**filters)
-            )
-        )
+        statement, params = _filtered(model_class, filters, QUERY_COUNT)
+        if session is not None:
+            return session.scalar(statement, params)
+        with self._session() as session:
+            return session.scalar(statement, params)
     
-    def exists(self, model_class: Type[Base], **filters) -> bool:
+    def exists(self, model_class: Type[Base], *, session: Optional[Session] = None,
+               **filters) -> bool:
         """
         Check if any objects exist matching the given filters.
+        Uses SELECT EXISTS so SQLite stops at the first matching row.
         
         Args:
             model_class: The model class to query
+            session: Optional session from unit_of_work() to run in
             **filters: Field names and values to filter by
             
         Returns:
@@ -464,7 +1050,11 @@ class DatabaseManagement:
         Example:
             has_bears = db_manager.exists(Customer, species="Bear")
         """
-        return self.count(model_class, **filters) > 0
+        statement, params = _filtered(model_class, filters, QUERY_EXISTS)
+        if session is not None:
+            return bool(session.scalar(statement, params))
+        with self._session() as session:
+            return bool(session.scalar(statement, params))
     
     def commit(self, session: Session) -> bool:
         """
@@ -487,7 +1077,7 @@ class DatabaseManagement:
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Commit failed: {e}")
+            logger.error("Commit failed: %s", e)
             return False
     
     def rollback(self, session: Session) -> None:
@@ -539,19 +1129,19 @@ class DatabaseManagement:
         if not hasattr(obj, 'id') or obj.id is None:
             return False
         
-        session = self.get_session()
+        session = self._session()
         try:
             # Get fresh instance from database
             fresh_obj = session.get(obj.__class__, obj.id)
             if fresh_obj:
                 # Update original object's attributes
-                for key in obj.__table__.columns.keys():
+                for key in _column_keys(type(obj)):
                     if hasattr(fresh_obj, key):
                         setattr(obj, key, getattr(fresh_obj, key))
                 return True
             return False
         except SQLAlchemyError as e:
-            print(f"Refresh failed: {e}")
+            logger.error("Refresh failed: %s", e)
             return False
         finally:
             session.close()
@@ -560,6 +1150,11 @@ class DatabaseManagement:
         """
         Save multiple objects in a single transaction.
         
+        Rows are written with one executemany INSERT per model class rather
+        than a unit-of-work flush per object. Relationships are not cascaded
+        and generated primary keys are not set on the passed objects; use
+        save() when the new IDs are needed.
+        
         Args:
             objects: List of SQLAlchemy model instances to save
             
@@ -571,7 +1166,7 @@ class DatabaseManagement:
             success = db_manager.bulk_save(customers)
         """
         return self.execute_transaction(
-            lambda session: session.add_all(objects)
+            lambda session: session.bulk_save_objects(objects)
         )
     
     def bulk_delete(self, objects: List[Base]) -> bool:
@@ -587,7 +1182,14 @@ class DatabaseManagement:
         Example:
             success = db_manager.bulk_delete(old_customers)
         """
-        return self.execute_transaction(
-            lambda session: [session.delete(session.merge(obj)) for obj in objects]
-        )
+        # Group primary keys by model so each class needs one statement
+        ids_by_class: Dict[Type[Base], List[int]] = {}
+        for obj in objects:
+            ids_by_class.setdefault(type(obj), []).append(obj.id)
+        
+        def delete_all(session: Session) -> None:
+            for model_class, ids in ids_by_class.items():
+                self._delete_by_ids(session, model_class, ids)
+        
+        return self.execute_transaction(delete_all)
 
@@ -5,8 +5,12 @@ Provides GUI for creating, viewing, editing, and managing appointments with mood
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, date, timedelta
-from typing import Optional, List
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, date, time, timedelta
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from typing import Optional, List, Dict, Tuple
 from database.db_manager import DatabaseManagement
 from models.appointment import Appointment
 from models.customer import Customer
@@ -15,14 +19,52 @@ from models.extra import Extra
 from services.appointment_service import AppointmentService
 from services.mood_recommendation_service import MoodRecommendationService
 from services.recommendation_service import RecommendationService
+from gui.mixins import BackgroundTasksMixin, RowWindowMixin, service_display
 
 
-class AppointmentWindow:
+# Display labels for appointment statuses, e.g. "no_show" -> "No Show"
+STATUS_DISPLAY = {
+    status: status.replace('_', ' ').title() for status in Appointment.get_statuses()
+}
+
+# Treeview tag colours per appointment status, applied once when the list is created
+STATUS_COLORS = {
+    Appointment.STATUS_SCHEDULED: 'blue',
+    Appointment.STATUS_COMPLETED: 'green',
+    Appointment.STATUS_CANCELLED: 'red',
+    Appointment.STATUS_NO_SHOW: 'orange',
+}
+
+# Lead-in for the customer recommendations label
+RECOMMENDATIONS_PREFIX = "\U0001F4A1 Recommendations: "
+
+# Fields read for each appointment list row, fetched in one call
+_get_row_fields = attrgetter(
+    'id', 'customer_id', 'service_id', 'appointment_datetime', 'status', 'customer_feeling'
+)
+
+
+class AppointmentWindow(BackgroundTasksMixin, RowWindowMixin):
     """
     Main window for appointment management.
     Provides full CRUD operations with mood-based recommendations.
     """
     
+    # Appointment list rows are virtualized: only the visible slice is in the Treeview
+    ROW_HEIGHT = 50
+    VISIBLE_ROWS = 20
+    
+    # Appointment list columns: (width, anchor)
+    COLUMN_SPECS = {
+        'ID': (50, tk.CENTER),
+        'Date': (100, tk.CENTER),
+        'Time': (80, tk.CENTER),
+        'Customer': (120, tk.CENTER),
+        'Service': (150, tk.CENTER),
+        'Status': (100, tk.CENTER),
+        'Feeling': (100, tk.CENTER),
+    }
+    
     def __init__(self, parent: tk.Tk, db_manager: DatabaseManagement):
         """
         Initialize appointment management window.
@@ -38,11 +80,46 @@ class AppointmentWindow:
         self.recommendation_service = RecommendationService(db_manager)
         self.current_appointment: Optional[Appointment] = None
         self.selected_extras: List[Extra] = []
+        self._extras_cache: List[Extra] = []
+        self._customer_by_display: Dict[str, Customer] = {}
+        self._service_by_display: Dict[str, Service] = {}
+        self._customer_display_by_id: Dict[int, str] = {}
+        self._service_display_by_id: Dict[int, str] = {}
+        self._customers_by_id: Dict[int, Customer] = {}
+        
+        # Prepared appointment rows, the filtered subset, and the visible window into it
+        self._all_prepared_rows: List[tuple] = []  # Newest first
+        self._prepared_datetimes: List[datetime] = []  # Oldest first, for bisect
+        self._date_bounds: Optional[Tuple[datetime, datetime]] = None
+        self._appointments_by_id: Dict[int, Appointment] = {}  # As loaded or last patched
+        self._rows_start = 0  # Filtered rows are _all_prepared_rows[_rows_start:_rows_stop]
+        self._rows_stop = 0
+        self._init_row_window()
+        self._last_feeling: Optional[Tuple[str, int]] = None  # (feeling, data version) on display
+        self._rec_pool: List[tuple] = []  # Reusable (frame, button, label) rows
+        self._rec_text_by_customer: Dict[int, Optional[str]] = {}  # Formatted recommendations
+        
+        # Debounced selection handlers; suppressed while the form is being filled
+        self._pending_rec_refresh = None
+        self._pending_extras_refresh = None
+        self._loading = False
+        
+        # Scheduled (start, end, id) intervals per service, sorted by start
+        self._services_by_id: Dict[int, Service] = {}
+        self._scheduled_intervals: Dict[int, List[Tuple[datetime, datetime, int]]] = {}
+        self._max_duration = timedelta(0)
+        
+        # Database work runs on one worker thread
+        self._init_background_tasks()
+        self._load_generation = 0
+        self._rendered_generation = 0
+        self._select_generation = 0
         
         # Create main window
         self.window = tk.Toplevel(parent)
         self.window.title("Panda Spa - Appointment Management")
         self.window.geometry("1200x800")
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self._create_widgets()
         self._load_appointments()
@@ -51,7 +128,7 @@ class AppointmentWindow:
         """Create and layout all GUI widgets."""
         # Configure Treeview style
         style = ttk.Style()
-        style.configure("Treeview", rowheight=50)
+        style.configure("Treeview", rowheight=self.ROW_HEIGHT)
         style.configure("Treeview.Heading", font=('Arial', 10, 'bold'))
         
         # Main container
@@ -119,8 +196,15 @@ class AppointmentWindow:
         extras_frame = ttk.LabelFrame(form_frame, text="Add Extras (Optional)", padding="5")
         extras_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
         
-        self.extras_listbox = tk.Listbox(extras_frame, height=4, selectmode=tk.MULTIPLE)
-        self.extras_listbox.pack(fill=tk.BOTH, expand=True)
+        self.extras_tree = ttk.Treeview(extras_frame, columns=('name', 'price'), show='headings',
+                                        height=4, selectmode='extended')
+        self.extras_tree.heading('name', text='Extra')
+        self.extras_tree.heading('price', text='Price')
+        self.extras_tree.column('name', width=160)
+        self.extras_tree.column('price', width=70, anchor=tk.E)
+        self.extras_tree.pack(fill=tk.BOTH, expand=True)
+        # Plain clicks toggle rows, like the multiple-selection listbox this replaces
+        self.extras_tree.bind('<Button-1>', self._on_extra_click)
         
         ttk.Label(form_frame, text="Notes:").grid(row=8, column=0, sticky=tk.W, pady=5)
         self.notes_text = tk.Text(form_frame, width=25, height=4)
@@ -160,28 +244,27 @@ class AppointmentWindow:
         tree_frame.rowconfigure(0, weight=1)
         
         # Appointments list
-        columns = ('ID', 'Date', 'Time', 'Customer', 'Service', 'Status', 'Feeling')
-        self.appointments_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=20)
+        columns = tuple(self.COLUMN_SPECS)
+        self.appointments_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=self.VISIBLE_ROWS)
         
-        for col in columns:
+        # Fixed widths: stretch=False stops Tk recomputing column widths as rows change
+        for col, (width, anchor) in self.COLUMN_SPECS.items():
             self.appointments_tree.heading(col, text=col)
-            self.appointments_tree.column(col, width=100, anchor=tk.CENTER)
+            self.appointments_tree.column(col, width=width, anchor=anchor, stretch=False)
         
-        self.appointments_tree.column('ID', width=50)
-        self.appointments_tree.column('Date', width=100)
-        self.appointments_tree.column('Time', width=80)
-        self.appointments_tree.column('Customer', width=120)
-        self.appointments_tree.column('Service', width=150)
-        self.appointments_tree.column('Status', width=100)
-        self.appointments_tree.column('Feeling', width=100)
+        # Status colours only need configuring once, not on every reload
+        for status, color in STATUS_COLORS.items():
+            self.appointments_tree.tag_configure(status, foreground=color)
         
         self.appointments_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.appointments_tree.bind('<Double-1>', self._on_appointment_select)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.appointments_tree.yview)
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.appointments_tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar drives the row window rather than the Treeview's own view
+        self.appointments_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._on_yscroll)
+        self.appointments_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self._attach_row_window(self.appointments_tree, self.appointments_scrollbar)
+        # Only the visible rows exist in the Treeview, so paging and edge arrow keys move the row window
+        self._bind_row_keys()
         
         # Action buttons for list
         action_frame = ttk.Frame(list_frame)
@@ -197,37 +280,90 @@ class AppointmentWindow:
         self._load_extras()
     
     def _load_customers(self):
-        """Load customers into combo box."""
+        """Load customers into combo box and the id lookup used for appointment rows."""
         customers = self.db_manager.get_all(Customer)
-        customer_list = [f"{c.id}: {c.name} ({c.species})" for c in customers]
-        self.customer_combo['values'] = customer_list
+        self._customers_by_id = {c.id: c for c in customers}
+        self._customer_by_display = {self._customer_display(c): c for c in customers}
+        self._customer_display_by_id = {c.id: display for display, c in self._customer_by_display.items()}
+        self.customer_combo['values'] = list(self._customer_by_display)
     
     def _load_services(self):
-        """Load available services into combo box."""
-        services = self.db_manager.find(Service, is_available=True)
-        service_list = [f"{s.id}: {s.name} (${s.price:.2f})" for s in services]
-        self.service_combo['values'] = service_list
+        """Load available services into combo box and all services into the id lookup."""
+        services = self.db_manager.get_all(Service)
+        self._services_by_id = {s.id: s for s in services}
+        self._service_by_display = {service_display(s): s for s in services if s.is_available}
+        self._service_display_by_id = {s.id: display for display, s in self._service_by_display.items()}
+        self.service_combo['values'] = list(self._service_by_display)
     
     def _load_extras(self):
-        """Load available extras into listbox."""
-        self.extras_listbox.delete(0, tk.END)
-        extras = self.db_manager.find(Extra, is_available=True)
-        for extra in extras:
-            self.extras_listbox.insert(tk.END, f"{extra.name} (+${extra.price:.2f})")
+        """Load available extras into the extras picker."""
+        self.extras_tree.delete(*self.extras_tree.get_children())
+        # Row iids are the extra ids from this list
+        self._extras_cache = self.db_manager.find(Extra, is_available=True)
+        for extra in self._extras_cache:
+            self.extras_tree.insert('', tk.END, iid=str(extra.id), values=(extra.name, f"+${extra.price:.2f}"))
+    
+    def _on_extra_click(self, event):
+        """Toggle the clicked extra without clearing the rest of the selection."""
+        iid = self.extras_tree.identify_row(event.y)
+        if iid:
+            self.extras_tree.selection_toggle(iid)
+        return "break"
+    
+    def _select_extras(self, extra_ids: set):
+        """Add the listed extras to the picker selection in one call."""
+        iids = [str(extra.id) for extra in self._extras_cache if extra.id in extra_ids]
+        if iids:
+            self.extras_tree.selection_add(iids)
+    
+    def _get_selected_extras(self) -> List[Extra]:
+        """Return the selected extras in list order."""
+        selected = set(self.extras_tree.selection())
+        return [extra for extra in self._extras_cache if str(extra.id) in selected]
+    
+    @staticmethod
+    def _customer_display(customer: Customer) -> str:
+        """Format a customer as its combobox string."""
+        return f"{customer.id}: {customer.name} ({customer.species})"
+    
+    @staticmethod
+    def _combo_id(display: str, by_display: Dict[str, object]) -> int:
+        """Return the id behind a "{id}: ..." combobox string, preferring the loaded objects."""
+        obj = by_display.get(display)
+        if obj is not None:
+            return obj.id
+        # Strings set from an appointment may name rows missing from the combobox lists
+        return int(display.partition(':')[0])
+    
+    @staticmethod
+    def _parse_form_datetime(date_str: str, time_str: str) -> datetime:
+        """Parse the form's "YYYY-MM-DD" and "HH:MM" fields into a naive datetime."""
+        text = f"{date_str} {time_str}"
+        # fromisoformat also takes "T" separators, seconds and offsets; only use it for the exact form shape
+        if len(text) == 16 and text[4] + text[7] + text[10] + text[13] == '-- :':
+            try:
+                parsed = datetime.fromisoformat(text)
+                if parsed.tzinfo is None:
+                    return parsed
+            except ValueError:
+                pass
+        # Slower path for other inputs, e.g. single-digit hours
+        return datetime.strptime(text, "%Y-%m-%d %H:%M")
     
     def _on_feeling_select(self, event=None):
         """Handle feeling selection and load recommendations."""
+        if self._loading:
+            return
         self._load_mood_recommendations()
     
     def _load_mood_recommendations(self):
         """Load mood-based recommendations."""
         feeling = self.feeling_combo.get()
-        if not feeling:
+        # Rebuild after services or mappings change, even for the same feeling
+        shown = (feeling, MoodRecommendationService._data_version)
+        if not feeling or shown == self._last_feeling:
             return
-        
-        # Clear previous recommendations
-        for widget in self.rec_services_frame.winfo_children():
-            widget.destroy()
+        self._last_feeling = shown
         
         # Get recommendations
         recs = self.mood_service.get_recommendations_by_feeling(feeling)
@@ -235,124 +371,369 @@ class AppointmentWindow:
         if recs['services']:
             self.recommendations_label.config(text=recs['message'], foreground="blue")
             
-            # Display recommended services as buttons
-            for service in recs['services']:
-                btn_frame = ttk.Frame(self.rec_services_frame)
-                btn_frame.pack(fill=tk.X, pady=2)
-                
-                btn_text = f"{service.name} (${service.price:.2f})"
-                btn = ttk.Button(btn_frame, text=btn_text, 
-                               command=lambda s=service: self._select_recommended_service(s))
-                btn.pack(side=tk.LEFT, padx=5)
+            # Display recommended services as buttons, reusing pooled rows
+            for i, service in enumerate(recs['services']):
+                btn_frame, btn, extras_label = self._get_rec_row(i)
+                btn.configure(text=f"{service.name} (${service.price:.2f})",
+                              command=lambda s=service: self._select_recommended_service(s))
                 
                 # Show recommended extras for this service
                 if service.id in recs['extras_by_service']:
                     extras = recs['extras_by_service'][service.id]
-                    extras_text = ", ".join([e.name for e in extras[:2]])
-                    ttk.Label(btn_frame, text=f"Extras: {extras_text}", font=("Arial", 8), foreground="gray").pack(side=tk.LEFT)
+                    extras_text = ", ".join(e.name for e in islice(extras, 2))
+                    extras_label.configure(text=f"Extras: {extras_text}")
+                    extras_label.pack(side=tk.LEFT)
+                else:
+                    extras_label.pack_forget()
+                
+                btn_frame.pack(fill=tk.X, pady=2)
+            
+            self._hide_rec_rows(len(recs['services']))
         else:
+            self._hide_rec_rows()
             self.recommendations_label.config(text="No recommendations available. Please ensure services are available.", foreground="gray")
     
+    def _get_rec_row(self, index: int) -> tuple:
+        """Return the pooled recommendation row at index, creating rows as needed."""
+        while len(self._rec_pool) <= index:
+            btn_frame = ttk.Frame(self.rec_services_frame)
+            btn = ttk.Button(btn_frame)
+            btn.pack(side=tk.LEFT, padx=5)
+            extras_label = ttk.Label(btn_frame, font=("Arial", 8), foreground="gray")
+            self._rec_pool.append((btn_frame, btn, extras_label))
+        return self._rec_pool[index]
+    
+    def _hide_rec_rows(self, start: int = 0):
+        """Hide pooled recommendation rows from start onwards."""
+        for btn_frame, _, _ in self._rec_pool[start:]:
+            btn_frame.pack_forget()
+    
     def _select_recommended_service(self, service: Service):
         """Select a recommended service."""
-        service_str = f"{service.id}: {service.name} (${service.price:.2f})"
+        service_str = service_display(service)
         self.service_combo.set(service_str)
-        self._on_service_select()
+        self._cancel_pending_refreshes()
+        self._refresh_service_extras()
         
         # Load recommended extras for this service
         feeling = self.feeling_combo.get()
         if feeling:
             extras = self.mood_service.get_extras_for_service_and_feeling(service.id, feeling)
             if extras:
-                # Select recommended extras in listbox
-                all_extras = self.db_manager.find(Extra, is_available=True)
-                for i, extra in enumerate(all_extras):
-                    if extra in extras:
-                        self.extras_listbox.selection_set(i)
+                # Select recommended extras in the picker
+                self._select_extras({e.id for e in extras})
     
     def _on_customer_select(self, event=None):
         """Handle customer selection and show recommendations."""
+        if self._loading:
+            return
+        if self._pending_rec_refresh is not None:
+            self.window.after_cancel(self._pending_rec_refresh)
+        self._pending_rec_refresh = self.window.after(150, self._run_rec_refresh)
+    
+    def _run_rec_refresh(self):
+        """Run a debounced recommendations refresh."""
+        self._pending_rec_refresh = None
         self._update_recommendations_display()
     
+    def _cancel_pending_refreshes(self):
+        """Cancel any debounced selection handlers that have not run yet."""
+        if self._pending_rec_refresh is not None:
+            self.window.after_cancel(self._pending_rec_refresh)
+            self._pending_rec_refresh = None
+        if self._pending_extras_refresh is not None:
+            self.window.after_cancel(self._pending_extras_refresh)
+            self._pending_extras_refresh = None
+    
     def _update_recommendations_display(self):
         """Update recommendations display when customer is selected."""
-        if not self.customer_combo.get():
+        customer_str = self.customer_combo.get()
+        if not customer_str:
             return
         
         try:
-            customer_id = int(self.customer_combo.get().split(':')[0])
+            customer_id = self._combo_id(customer_str, self._customer_by_display)
+        except (ValueError, IndexError):
+            return
+        
+        # Recommendations only change when the customer's history does
+        if customer_id in self._rec_text_by_customer:
+            rec_text = self._rec_text_by_customer[customer_id]
+        else:
+            rec_text = None
             recommendations = self.recommendation_service.get_recommendations(customer_id, limit=3)
-            
             if recommendations:
-                rec_names = []
-                for rec in recommendations[:2]:
-                    service_name = rec[0].name
-                    score = rec[1]
-                    if score > 0:
-                        rec_names.append(f"{service_name} ({score:.1f}/10)")
-                    else:
-                        rec_names.append(service_name)
-                rec_text = "💡 Recommendations: " + ", ".join(rec_names)
-                self.recommendations_label.config(text=rec_text, foreground="blue")
-        except (ValueError, IndexError):
-            pass
+                rec_text = RECOMMENDATIONS_PREFIX + ", ".join(
+                    f"{service.name} ({score:.1f}/10)" if score > 0 else service.name
+                    for service, score, _ in islice(recommendations, 2)
+                )
+            self._rec_text_by_customer[customer_id] = rec_text
+        
+        if rec_text:
+            self.recommendations_label.config(text=rec_text, foreground="blue")
+            # The mood message is gone, so the next feeling lookup must redraw it
+            self._last_feeling = None
     
     def _on_service_select(self, event=None):
         """Handle service selection and update extras."""
-        # Update extras list based on service compatibility
-        if not self.service_combo.get():
+        if self._loading:
             return
-        
-        try:
-            service_id = int(self.service_combo.get().split(':')[0])
-            service = self.db_manager.get_by_id(Service, service_id)
-            if service:
-                # Filter extras by compatibility
-                self._load_extras()  # Reload all extras
-                # Could add filtering logic here if needed
-        except (ValueError, IndexError):
-            pass
+        if self._pending_extras_refresh is not None:
+            self.window.after_cancel(self._pending_extras_refresh)
+        self._pending_extras_refresh = self.window.after(150, self._run_extras_refresh)
+    
+    def _run_extras_refresh(self):
+        """Run a debounced extras refresh."""
+        self._pending_extras_refresh = None
+        self._refresh_service_extras()
+    
+    def _refresh_service_extras(self):
+        """Reload the extras list for the selected service."""
+        # Update extras list based on service compatibility
+        service = self._service_by_display.get(self.service_combo.get())
+        if service:
+            # Filter extras by compatibility
+            self._load_extras()  # Reload all extras
+            # Could add filtering logic here if needed
     
     def _load_appointments(self):
-        """Load appointments into treeview."""
-        for item in self.appointments_tree.get_children():
-            self.appointments_tree.delete(item)
+        """Fetch appointments on the worker thread; rows are rendered when results arrive."""
+        self._load_generation += 1
+        self._run_in_background(
+            self._fetch_appointments_data,
+            partial(self._on_appointments_loaded, self._load_generation)
+        )
+    
+    def _fetch_appointments_data(self) -> tuple:
+        """
+        Query appointments and build everything the list needs (runs on the worker thread).
+        
+        Returns:
+            Tuple of (newest-first rows, oldest-first datetimes, (interval index, longest duration),
+            appointments by id)
+        """
+        appointments = self.db_manager.get_all(Appointment, order_by='appointment_datetime', descending=True)
+        # Names resolve through the customer/service dicts kept by the combobox loaders
+        rows = [self._prepare_row(appointment) for appointment in appointments]
+        datetimes = [a.appointment_datetime for a in reversed(appointments)]
+        by_id = {appointment.id: appointment for appointment in appointments}
+        return rows, datetimes, self._index_intervals(appointments), by_id
+    
+    def _on_appointments_loaded(self, generation: int, data: Optional[tuple],
+                                error: Optional[Exception]):
+        """Render a finished load unless a newer one has been started since."""
+        if generation != self._load_generation:
+            return
+        self._rendered_generation = generation
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load appointments: {error}")
+        else:
+            self._render_appointments(data)
+    
+    def _on_close(self):
+        """Stop background work and close the window."""
+        self._cancel_pending_refreshes()
+        self._cancel_refresh()
+        self._stop_background_tasks()
+        self.window.destroy()
+    
+    def _render_appointments(self, data: tuple):
+        """Swap in the rows prepared on the worker thread and show the visible window."""
+        rows, datetimes, (intervals, max_duration), by_id = data
+        self._appointments_by_id = by_id
+        self._all_prepared_rows = rows
+        self._prepared_datetimes = datetimes
+        self._scheduled_intervals = intervals
+        self._max_duration = max_duration
+        self._apply_filter()
+    
+    def _prepare_row(self, appointment: Appointment) -> tuple:
+        """Build the (values, tags) treeview row for an appointment."""
+        appointment_id, customer_id, service_id, dt, status, feeling = _get_row_fields(appointment)
+        customer = self._customers_by_id.get(customer_id)
+        service = self._services_by_id.get(service_id)
+        # isoformat slicing is considerably cheaper than two strftime calls
+        iso = dt.isoformat(sep=' ', timespec='minutes')
+        
+        return ((
+            appointment_id,
+            iso[:10],
+            iso[11:16],
+            customer.name if customer else f"ID:{customer_id}",
+            service.name if service else f"ID:{service_id}",
+            STATUS_DISPLAY.get(status) or status.replace('_', ' ').title(),
+            feeling or "N/A"
+        ), (status,))
+    
+    def _find_row_index(self, appointment_id: int, appointment_datetime: datetime) -> Optional[int]:
+        """Return the newest-first row index of an appointment, located by bisecting its datetime."""
+        total = len(self._prepared_datetimes)
+        lo = bisect_left(self._prepared_datetimes, appointment_datetime)
+        hi = bisect_right(self._prepared_datetimes, appointment_datetime)
+        for index in range(total - hi, total - lo):
+            if self._all_prepared_rows[index][0][0] == appointment_id:
+                return index
+        return None
+    
+    def _add_appointment_row(self, appointment: Appointment):
+        """Insert one appointment into the loaded rows and conflict index."""
+        # Rows sharing a datetime sit in id order, matching a full reload
+        total = len(self._prepared_datetimes)
+        lo = bisect_left(self._prepared_datetimes, appointment.appointment_datetime)
+        hi = bisect_right(self._prepared_datetimes, appointment.appointment_datetime)
+        index = total - hi
+        while index < total - lo and self._all_prepared_rows[index][0][0] < appointment.id:
+            index += 1
+        self._all_prepared_rows.insert(index, self._prepare_row(appointment))
+        self._prepared_datetimes.insert(total - index, appointment.appointment_datetime)
+        self._appointments_by_id[appointment.id] = appointment
+        
+        if appointment.status == Appointment.STATUS_SCHEDULED:
+            duration = timedelta(minutes=appointment.duration_minutes)
+            start = appointment.appointment_datetime
+            insort(self._scheduled_intervals.setdefault(appointment.service_id, []),
+                   (start, start + duration, appointment.id))
+            self._max_duration = max(self._max_duration, duration)
+    
+    def _remove_appointment_row(self, appointment: Appointment):
+        """Remove one appointment, as it was when loaded, from the rows and conflict index."""
+        index = self._find_row_index(appointment.id, appointment.appointment_datetime)
+        if index is not None:
+            del self._all_prepared_rows[index]
+            del self._prepared_datetimes[len(self._prepared_datetimes) - 1 - index]
+        self._appointments_by_id.pop(appointment.id, None)
+        
+        intervals = self._scheduled_intervals.get(appointment.service_id, [])
+        for i, interval in enumerate(intervals):
+            if interval[2] == appointment.id:
+                del intervals[i]
+                break
+    
+    def _fetch_missing_related(self, appointment: Optional[Appointment]) -> tuple:
+        """
+        Fetch an appointment's customer and service when the name lookups lack them.
         
-        appointments = self.db_manager.get_all(Appointment)
-        appointments.sort(key=lambda x: x.appointment_datetime, reverse=True)
+        Runs on the worker thread, in the task that saved the appointment, since
+        objects created after the last load are not in the lookups yet.
         
-        for appointment in appointments:
+        Returns:
+            Tuple of (customer or None, service or None)
+        """
+        if appointment is None:
+            return None, None
+        customer = None
+        if appointment.customer_id not in self._customers_by_id:
             customer = self.db_manager.get_by_id(Customer, appointment.customer_id)
+        service = None
+        if appointment.service_id not in self._services_by_id:
             service = self.db_manager.get_by_id(Service, appointment.service_id)
-            
-            customer_name = customer.name if customer else f"ID:{appointment.customer_id}"
-            service_name = service.name if service else f"ID:{appointment.service_id}"
-            date_str = appointment.appointment_datetime.strftime('%Y-%m-%d')
-            time_str = appointment.appointment_datetime.strftime('%H:%M')
-            status_display = appointment.status.replace('_', ' ').title()
-            feeling = appointment.customer_feeling or "N/A"
-            
-            tag = appointment.status
-            self.appointments_tree.insert('', tk.END, values=(
-                appointment.id,
-                date_str,
-                time_str,
-                customer_name,
-                service_name,
-                status_display,
-                feeling
-            ), tags=(tag,))
-        
-        # Configure tags
-        self.appointments_tree.tag_configure('scheduled', foreground='blue')
-        self.appointments_tree.tag_configure('completed', foreground='green')
-        self.appointments_tree.tag_configure('cancelled', foreground='red')
-        self.appointments_tree.tag_configure('no_show', foreground='orange')
+        return customer, service
+    
+    def _remember_related(self, related: tuple):
+        """Add a customer and service from _fetch_missing_related to the name lookups."""
+        customer, service = related
+        if customer:
+            self._customers_by_id[customer.id] = customer
+        if service:
+            self._services_by_id[service.id] = service
+    
+    def _patch_appointment_rows(self, old: Optional[Appointment], new: Optional[Appointment]):
+        """
+        Apply a single-appointment change to the list without reloading everything.
+        
+        Args:
+            old: Appointment as currently shown, or None when it was just created
+            new: Appointment as now stored, or None when it was deleted
+        """
+        if self._rendered_generation != self._load_generation:
+            # A load is still in flight. It was queued on the single worker after the
+            # task that made this change, so its results already include it.
+            return
+        if old is not None:
+            self._remove_appointment_row(old)
+        if new is not None:
+            self._add_appointment_row(new)
+        self._apply_filter(keep_position=True)
+    
+    @staticmethod
+    def _index_intervals(appointments: List[Appointment]) -> tuple:
+        """
+        Index scheduled appointments by service as sorted (start, end, id) intervals.
+        
+        Returns:
+            Tuple of (intervals by service id, longest scheduled duration)
+        """
+        index: Dict[int, List[Tuple[datetime, datetime, int]]] = {}
+        max_duration = timedelta(0)
+        for appointment in appointments:
+            if appointment.status != Appointment.STATUS_SCHEDULED:
+                continue
+            duration = timedelta(minutes=appointment.duration_minutes)
+            start = appointment.appointment_datetime
+            index.setdefault(appointment.service_id, []).append((start, start + duration, appointment.id))
+            max_duration = max(max_duration, duration)
+        for intervals in index.values():
+            intervals.sort()
+        return index, max_duration
+    
+    def _find_local_conflict(self, service_id: int, start: datetime, duration_minutes: int) -> Optional[datetime]:
+        """
+        Find a loaded scheduled appointment overlapping the proposed slot.
+        
+        Returns:
+            Start time of the conflicting appointment, or None
+        """
+        intervals = self._scheduled_intervals.get(service_id)
+        if not intervals:
+            return None
+        
+        end = start + timedelta(minutes=duration_minutes)
+        # Candidates start before the proposed end; walk back until none can reach the start
+        i = bisect_left(intervals, (end,))
+        earliest = start - self._max_duration
+        while i > 0:
+            i -= 1
+            other_start, other_end, _ = intervals[i]
+            if other_start <= earliest:
+                break
+            if other_end > start:
+                return other_start
+        return None
+    
+    def _apply_filter(self, keep_position: bool = False):
+        """Select the prepared rows inside the current date bounds without copying them."""
+        total = len(self._prepared_datetimes)
+        if self._date_bounds is None:
+            self._rows_start, self._rows_stop = 0, total
+        else:
+            # Bisect the ascending datetimes and map the range onto the newest-first rows
+            start, end = self._date_bounds
+            lo = bisect_left(self._prepared_datetimes, start)
+            hi = bisect_left(self._prepared_datetimes, end)
+            self._rows_start, self._rows_stop = total - hi, total - lo
+        if not keep_position:
+            self._first_row = 0
+        self._refresh_visible()
+    
+    def _row_count(self) -> int:
+        """Return the number of appointments inside the current date bounds."""
+        return self._rows_stop - self._rows_start
+    
+    def _window_rows(self, first: int, last: int) -> Dict[str, tuple]:
+        """Return filtered rows first to last as {iid: (values, tags)}, keyed by appointment id."""
+        offset = self._rows_start
+        return {str(row[0][0]): row for row in self._all_prepared_rows[offset + first:offset + last]}
     
     def _filter_appointments(self, filter_type: str):
-        """Filter appointments by date range."""
-        self._load_appointments()  # Reload all for now
-        # Could add date filtering logic here
+        """Filter the loaded appointments by date range without re-querying."""
+        start = datetime.combine(date.today(), time.min)
+        if filter_type == "today":
+            self._date_bounds = (start, start + timedelta(days=1))
+        elif filter_type == "week":
+            self._date_bounds = (start, start + timedelta(days=7))
+        else:
+            self._date_bounds = None
+        self._apply_filter()
     
     def _on_appointment_select(self, event):
         """Handle appointment selection from list."""
@@ -362,39 +743,67 @@ class AppointmentWindow:
         
         item = self.appointments_tree.item(selection[0])
         appointment_id = int(item['values'][0])
-        self.current_appointment = self.db_manager.get_by_id(Appointment, appointment_id)
+        # The loaded appointment backs the row; only its extras are not loaded with the list
+        appointment = self._appointments_by_id.get(appointment_id)
+        if appointment is None:
+            return
         
-        if self.current_appointment:
-            self._load_appointment_to_form()
+        self._select_generation += 1
+        self._run_in_background(
+            partial(self.appointment_service.get_appointment_extras, appointment.id),
+            partial(self._on_appointment_extras_loaded, self._select_generation, appointment)
+        )
     
-    def _load_appointment_to_form(self):
-        """Load selected appointment into form."""
-        if not self.current_appointment:
+    def _on_appointment_extras_loaded(self, generation: int, appointment: Appointment,
+                                      extras: Optional[List[Extra]], error: Optional[Exception]):
+        """Show the most recently selected appointment once its extras are loaded."""
+        if generation != self._select_generation:
             return
-        
-        # Reload appointment to ensure it's bound to session
-        self.current_appointment = self.db_manager.get_by_id(Appointment, self.current_appointment.id)
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load appointment extras: {error}")
+            return
+        self.current_appointment = appointment
+        self._load_appointment_to_form(extras)
+    
+    def _load_appointment_to_form(self, extras: List[Extra]):
+        """Load selected appointment into form without triggering selection handlers."""
+        self._cancel_pending_refreshes()
+        self._loading = True
+        try:
+            self._populate_form(extras)
+        finally:
+            self._loading = False
+    
+    def _populate_form(self, extras: List[Extra]):
+        """Fill the form fields from the current appointment and its extras."""
         if not self.current_appointment:
             return
         
-        # Load customer
-        customer = self.db_manager.get_by_id(Customer, self.current_appointment.customer_id)
-        if customer:
-            customer_str = f"{customer.id}: {customer.name} ({customer.species})"
+        # Load customer and service from the strings and objects already loaded
+        customer_id = self.current_appointment.customer_id
+        customer_str = self._customer_display_by_id.get(customer_id)
+        if customer_str is None and customer_id in self._customers_by_id:
+            customer_str = self._customer_display(self._customers_by_id[customer_id])
+            self._customer_display_by_id[customer_id] = customer_str
+        if customer_str:
             self.customer_combo.set(customer_str)
         
-        # Load service
-        service = self.db_manager.get_by_id(Service, self.current_appointment.service_id)
-        if service:
-            service_str = f"{service.id}: {service.name} (${service.price:.2f})"
+        service_id = self.current_appointment.service_id
+        service_str = self._service_display_by_id.get(service_id)
+        if service_str is None and service_id in self._services_by_id:
+            # Unavailable services are not in the combobox list but still get a string
+            service_str = service_display(self._services_by_id[service_id])
+            self._service_display_by_id[service_id] = service_str
+        if service_str:
             self.service_combo.set(service_str)
         
         # Load date and time
+        iso = self.current_appointment.appointment_datetime.isoformat(sep=' ', timespec='minutes')
         self.date_entry.delete(0, tk.END)
-        self.date_entry.insert(0, self.current_appointment.appointment_datetime.strftime('%Y-%m-%d'))
+        self.date_entry.insert(0, iso[:10])
         
         self.time_entry.delete(0, tk.END)
-        self.time_entry.insert(0, self.current_appointment.appointment_datetime.strftime('%H:%M'))
+        self.time_entry.insert(0, iso[11:16])
         
         # Load feeling
         if self.current_appointment.customer_feeling:
@@ -408,38 +817,36 @@ class AppointmentWindow:
             self.notes_text.insert('1.0', self.current_appointment.notes)
         
         # Load extras
-        self.extras_listbox.selection_clear(0, tk.END)
-        if self.current_appointment.extras:
-            all_extras = self.db_manager.find(Extra, is_available=True)
-            current_extra_ids = {e.id for e in self.current_appointment.extras}
-            for i, extra in enumerate(all_extras):
-                if extra.id in current_extra_ids:
-                    self.extras_listbox.selection_set(i)
+        self.extras_tree.selection_set(())
+        if extras:
+            self._select_extras({e.id for e in extras})
         
         # Store selected extras for update
-        self.selected_extras = list(self.current_appointment.extras) if self.current_appointment.extras else []
+        self.selected_extras = extras
     
     def _create_appointment(self):
         """Create a new appointment."""
         try:
             # Get customer
-            if not self.customer_combo.get():
+            customer_str = self.customer_combo.get()
+            if not customer_str:
                 messagebox.showerror("Error", "Please select a customer!")
                 return
             
-            customer_id = int(self.customer_combo.get().split(':')[0])
+            customer_id = self._combo_id(customer_str, self._customer_by_display)
             
             # Get service
-            if not self.service_combo.get():
+            service_str = self.service_combo.get()
+            if not service_str:
                 messagebox.showerror("Error", "Please select a service!")
                 return
             
-            service_id = int(self.service_combo.get().split(':')[0])
+            service_id = self._combo_id(service_str, self._service_by_display)
             
             # Get date and time
             date_str = self.date_entry.get()
             time_str = self.time_entry.get()
-            appointment_datetime = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+            appointment_datetime = self._parse_form_datetime(date_str, time_str)
             
             # Get feeling
             feeling = self.feeling_combo.get() or None
@@ -447,35 +854,51 @@ class AppointmentWindow:
             # Get notes
             notes = self.notes_text.get('1.0', tk.END).strip()
             
-            # Create appointment
-            appointment, error = self.appointment_service.create_appointment(
-                customer_id, service_id, appointment_datetime, notes, feeling
-            )
+            # Reject obvious conflicts against the loaded schedule before hitting the service
+            service = self._services_by_id.get(service_id)
+            if service:
+                conflict_start = self._find_local_conflict(service_id, appointment_datetime, service.duration_minutes)
+                if conflict_start:
+                    messagebox.showerror(
+                        "Error",
+                        f"Time slot conflict: Conflicts with appointment at {conflict_start.strftime('%Y-%m-%d %H:%M')}"
+                    )
+                    return
             
-            if error:
-                messagebox.showerror("Error", error)
-                return
+            # Get selected extras
+            selected_extras = self._get_selected_extras()
             
-            # Add extras
-            selected_indices = self.extras_listbox.curselection()
-            if selected_indices:
-                all_extras = self.db_manager.find(Extra, is_available=True)
-                for idx in selected_indices:
-                    extra = all_extras[idx]
-                    appointment.extras.append(extra)
-                    appointment.price_paid += extra.price
-                    appointment.duration_minutes += extra.duration_minutes
-                self.db_manager.save(appointment)
+            def create():
+                # Create appointment together with its extras on the worker thread
+                appointment, error = self.appointment_service.create_appointment(
+                    customer_id, service_id, appointment_datetime, notes, feeling,
+                    extras=selected_extras
+                )
+                return appointment, error, self._fetch_missing_related(appointment)
             
-            messagebox.showinfo("Success", "Appointment created successfully!")
-            self._clear_form()
-            self._load_appointments()
+            self._run_in_background(create, self._on_appointment_created)
             
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create appointment: {e}")
     
+    def _on_appointment_created(self, result: Optional[tuple], exception: Optional[Exception]):
+        """Report a finished create and add the new row."""
+        if exception is not None:
+            messagebox.showerror("Error", f"Failed to create appointment: {exception}")
+            return
+        
+        appointment, error, related = result
+        if error:
+            messagebox.showerror("Error", error)
+            return
+        
+        messagebox.showinfo("Success", "Appointment created successfully!")
+        self._clear_form()
+        self._remember_related(related)
+        self._patch_appointment_rows(None, appointment)
+    
     def _update_appointment(self):
         """Update existing appointment."""
         if not self.current_appointment:
@@ -483,41 +906,28 @@ class AppointmentWindow:
             return
         
         try:
-            # Reload appointment to ensure it's current
             appointment_id = self.current_appointment.id
-            self.current_appointment = self.db_manager.get_by_id(Appointment, appointment_id)
-            
-            if not self.current_appointment:
-                messagebox.showerror("Error", "Appointment not found!")
-                return
-            
-            # Check if appointment can be updated
-            if self.current_appointment.status == Appointment.STATUS_COMPLETED:
-                messagebox.showerror("Error", "Cannot update a completed appointment!")
-                return
-            
-            if self.current_appointment.status == Appointment.STATUS_CANCELLED:
-                messagebox.showerror("Error", "Cannot update a cancelled appointment!")
-                return
             
             # Get customer
-            if not self.customer_combo.get():
+            customer_str = self.customer_combo.get()
+            if not customer_str:
                 messagebox.showerror("Error", "Please select a customer!")
                 return
             
-            customer_id = int(self.customer_combo.get().split(':')[0])
+            customer_id = self._combo_id(customer_str, self._customer_by_display)
             
             # Get service
-            if not self.service_combo.get():
+            service_str = self.service_combo.get()
+            if not service_str:
                 messagebox.showerror("Error", "Please select a service!")
                 return
             
-            service_id = int(self.service_combo.get().split(':')[0])
+            service_id = self._combo_id(service_str, self._service_by_display)
             
             # Get date and time
             date_str = self.date_entry.get()
             time_str = self.time_entry.get()
-            appointment_datetime = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+            appointment_datetime = self._parse_form_datetime(date_str, time_str)
             
             # Get feeling
             feeling = self.feeling_combo.get() or None
@@ -526,35 +936,52 @@ class AppointmentWindow:
             notes = self.notes_text.get('1.0', tk.END).strip()
             
             # Get selected extras
-            selected_indices = self.extras_listbox.curselection()
-            selected_extras = []
-            if selected_indices:
-                all_extras = self.db_manager.find(Extra, is_available=True)
-                selected_extras = [all_extras[idx] for idx in selected_indices]
+            selected_extras = self._get_selected_extras()
             
-            # Update appointment using service
-            success, error = self.appointment_service.update_appointment(
-                appointment_id=appointment_id,
-                customer_id=customer_id,
-                service_id=service_id,
-                appointment_datetime=appointment_datetime,
-                notes=notes,
-                customer_feeling=feeling,
-                extras=selected_extras if selected_extras else None
-            )
+            def update():
+                # Reload appointment to ensure it's current; the service checks its status
+                previous = self.db_manager.get_by_id(Appointment, appointment_id)
+                if not previous:
+                    return None, None, "Appointment not found!", (None, None)
+                
+                # Update appointment using service
+                success, error = self.appointment_service.update_appointment(
+                    appointment_id=appointment_id,
+                    customer_id=customer_id,
+                    service_id=service_id,
+                    appointment_datetime=appointment_datetime,
+                    notes=notes,
+                    customer_feeling=feeling,
+                    extras=selected_extras if selected_extras else None
+                )
+                if not success:
+                    return previous, None, error, (None, None)
+                appointment = self.db_manager.get_by_id(Appointment, appointment_id)
+                return previous, appointment, None, self._fetch_missing_related(appointment)
             
-            if success:
-                messagebox.showinfo("Success", "Appointment updated successfully!")
-                self._clear_form()
-                self._load_appointments()
-            else:
-                messagebox.showerror("Error", error)
+            self._run_in_background(update, self._on_appointment_updated)
                 
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update appointment: {e}")
     
+    def _on_appointment_updated(self, result: Optional[tuple], exception: Optional[Exception]):
+        """Report a finished update and patch the changed row."""
+        if exception is not None:
+            messagebox.showerror("Error", f"Failed to update appointment: {exception}")
+            return
+        
+        previous, appointment, error, related = result
+        if error:
+            messagebox.showerror("Error", error)
+            return
+        
+        messagebox.showinfo("Success", "Appointment updated successfully!")
+        self._clear_form()
+        self._remember_related(related)
+        self._patch_appointment_rows(previous, appointment)
+    
     def _complete_appointment(self):
         """Mark selected appointment as completed."""
         selection = self.appointments_tree.selection()
@@ -565,12 +992,30 @@ class AppointmentWindow:
         item = self.appointments_tree.item(selection[0])
         appointment_id = int(item['values'][0])
         
-        success, error = self.appointment_service.complete_appointment(appointment_id)
-        if success:
-            messagebox.showinfo("Success", "Appointment marked as completed!")
-            self._load_appointments()
-        else:
+        def complete():
+            success, error = self.appointment_service.complete_appointment(appointment_id)
+            if not success:
+                return None, error
+            return self.db_manager.get_by_id(Appointment, appointment_id), None
+        
+        self._run_in_background(complete, self._on_appointment_completed)
+    
+    def _on_appointment_completed(self, result: Optional[tuple], exception: Optional[Exception]):
+        """Report a finished completion and patch the row's status."""
+        appointment, error = result if exception is None else (None, str(exception))
+        if error:
             messagebox.showerror("Error", error)
+            return
+        
+        messagebox.showinfo("Success", "Appointment marked as completed!")
+        if appointment is None:
+            # Deleted elsewhere after completing; the database is the only reliable view
+            self._load_appointments()
+            return
+        # The visit updated the customer's preferences
+        self._rec_text_by_customer.pop(appointment.customer_id, None)
+        # Only the status changed, so the stored row locates the displayed one
+        self._patch_appointment_rows(appointment, appointment)
     
     def _cancel_appointment(self):
         """Cancel selected appointment."""
@@ -585,12 +1030,28 @@ class AppointmentWindow:
         from tkinter import simpledialog
         reason = simpledialog.askstring("Cancel Appointment", "Reason for cancellation:")
         if reason:
-            success, error = self.appointment_service.cancel_appointment(appointment_id, reason)
-            if success:
-                messagebox.showinfo("Success", "Appointment cancelled!")
-                self._load_appointments()
-            else:
-                messagebox.showerror("Error", error)
+            def cancel():
+                success, error = self.appointment_service.cancel_appointment(appointment_id, reason)
+                if not success:
+                    return None, error
+                return self.db_manager.get_by_id(Appointment, appointment_id), None
+            
+            self._run_in_background(cancel, self._on_appointment_cancelled)
+    
+    def _on_appointment_cancelled(self, result: Optional[tuple], exception: Optional[Exception]):
+        """Report a finished cancellation and patch the row's status."""
+        appointment, error = result if exception is None else (None, str(exception))
+        if error:
+            messagebox.showerror("Error", error)
+            return
+        
+        messagebox.showinfo("Success", "Appointment cancelled!")
+        if appointment is None:
+            # Deleted elsewhere after cancelling; the database is the only reliable view
+            self._load_appointments()
+            return
+        # Only the status changed, so the stored row locates the displayed one
+        self._patch_appointment_rows(appointment, appointment)
     
     def _delete_appointment(self):
         """Delete selected appointment."""
@@ -605,14 +1066,33 @@ class AppointmentWindow:
         item = self.appointments_tree.item(selection[0])
         appointment_id = int(item['values'][0])
         
-        appointment = self.db_manager.get_by_id(Appointment, appointment_id)
-        if appointment:
-            self.db_manager.delete(appointment)
-            messagebox.showinfo("Success", "Appointment deleted!")
-            self._load_appointments()
+        def delete():
+            appointment = self.db_manager.get_by_id(Appointment, appointment_id)
+            if not appointment:
+                return None, False
+            return appointment, self.db_manager.delete(appointment)
+        
+        self._run_in_background(delete, self._on_appointment_deleted)
+    
+    def _on_appointment_deleted(self, result: Optional[tuple], exception: Optional[Exception]):
+        """Report a finished delete and drop the row once it is gone from the database."""
+        if exception is not None:
+            messagebox.showerror("Error", f"Failed to delete appointment: {exception}")
+            return
+        
+        appointment, success = result
+        if not appointment:
+            return
+        if not success:
+            messagebox.showerror("Error", "Failed to delete appointment")
+            return
+        
+        messagebox.showinfo("Success", "Appointment deleted!")
+        self._patch_appointment_rows(appointment, None)
     
     def _clear_form(self):
         """Clear the appointment form."""
+        self._select_generation += 1  # Drop extras still loading for an earlier selection
         self.customer_combo.set('')
         self.service_combo.set('')
         self.date_entry.delete(0, tk.END)
@@ -621,12 +1101,12 @@ class AppointmentWindow:
         self.time_entry.insert(0, "10:00")
         self.feeling_combo.set('')
         self.notes_text.delete('1.0', tk.END)
-        self.extras_listbox.selection_clear(0, tk.END)
+        self.extras_tree.selection_set(())
         self.current_appointment = None
         self.conflict_label.config(text="")
         
         # Clear recommendations
-        for widget in self.rec_services_frame.winfo_children():
-            widget.destroy()
+        self._hide_rec_rows()
         self.recommendations_label.config(text="")
+        self._last_feeling = None
 
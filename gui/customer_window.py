@@ -5,17 +5,28 @@ Provides GUI for creating, viewing, editing, and deleting customers.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, List
+from functools import partial
+from operator import attrgetter
+from typing import Optional, List, Dict, Iterable
 from database.db_manager import DatabaseManagement
 from models.customer import Customer
+from gui.mixins import BackgroundTasksMixin, RowWindowMixin
 
 
-class CustomerWindow:
+class CustomerWindow(BackgroundTasksMixin, RowWindowMixin):
     """
     Main window for customer management.
     Provides full CRUD operations for customers.
     """
     
+    # Customer list rows are virtualized: only the visible slice is in the Treeview
+    ROW_HEIGHT = 50
+    VISIBLE_ROWS = 15
+    
+    # Columns the customer list needs; full objects are only loaded for the form
+    LIST_FIELDS = ('id', 'name', 'species', 'contact_info', 'total_visits', 'total_spent', 'is_active')
+    _list_values = attrgetter(*LIST_FIELDS)
+    
     def __init__(self, parent: tk.Tk, db_manager: DatabaseManagement):
         """
         Initialize customer management window.
@@ -28,19 +39,41 @@ class CustomerWindow:
         self.db_manager = db_manager
         self.current_customer: Optional[Customer] = None
         
+        # Formatted rows of the current list and the visible window into it
+        self._rows: List[tuple] = []
+        self._init_row_window()
+        
+        # Formatted rows from the last load and their lowercased search keys, so
+        # searches filter in memory; mutations patch them via _patch_customer_row
+        self._display_rows: List[tuple] = []
+        self._search_index: List[tuple] = []
+        # Full customers fetched for the form since the last load, by id
+        self._customers_by_id: Dict[int, Customer] = {}
+        self._search_after_id = None  # Pending debounced search
+        self._last_search_text = ''  # Search text the list currently reflects
+        
+        # Database work runs on one worker thread
+        self._init_background_tasks()
+        self._load_generation = 0
+        self._rendered_generation = 0
+        self._select_generation = 0
+        
         # Create main window
         self.window = tk.Toplevel(parent)
         self.window.title("Panda Spa - Customer Management")
         self.window.geometry("900x700")
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self._create_widgets()
-        self._load_customers()
+        # Let the window draw before the form is filled in and the first load is started
+        self._form_job = self.window.after_idle(self._ensure_form_built)
+        self._load_job = self.window.after_idle(self._load_customers)
     
     def _create_widgets(self):
         """Create and layout all GUI widgets."""
         # Configure Treeview style to set row height (prevents overlapping rows)
         style = ttk.Style()
-        style.configure("Treeview", rowheight=50)  # Set row height to 30 pixels
+        style.configure("Treeview", rowheight=self.ROW_HEIGHT)
         style.configure("Treeview.Heading", font=('Arial', 10, 'bold'))
         
         # Main container
@@ -57,35 +90,9 @@ class CustomerWindow:
         form_frame = ttk.LabelFrame(main_frame, text="Customer Information", padding="10")
         form_frame.grid(row=0, column=0, rowspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
         
-        # Form fields
-        ttk.Label(form_frame, text="Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.name_entry = ttk.Entry(form_frame, width=25)
-        self.name_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
-        
-        ttk.Label(form_frame, text="Species:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.species_entry = ttk.Entry(form_frame, width=25)
-        self.species_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
-        
-        ttk.Label(form_frame, text="Contact Info:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.contact_entry = ttk.Entry(form_frame, width=25)
-        self.contact_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
-        
-        ttk.Label(form_frame, text="Notes:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.notes_text = tk.Text(form_frame, width=25, height=5)
-        self.notes_text.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
-        
-        self.is_active_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(form_frame, text="Active", variable=self.is_active_var).grid(
-            row=4, column=1, sticky=tk.W, pady=5, padx=(5, 0)
-        )
-        
-        # Form buttons
-        button_frame = ttk.Frame(form_frame)
-        button_frame.grid(row=5, column=0, columnspan=2, pady=10)
-        
-        ttk.Button(button_frame, text="Create New", command=self._create_customer).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Update", command=self._update_customer).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Clear", command=self._clear_form).pack(side=tk.LEFT, padx=5)
+        # Form fields are built once the window has drawn (see _ensure_form_built)
+        self._form_frame = form_frame
+        self._form_built = False
         
         # Right panel - Customer List
         list_frame = ttk.LabelFrame(main_frame, text="Customers", padding="10")
@@ -118,7 +125,7 @@ class CustomerWindow:
         
         # Customer list (Treeview)
         columns = ('ID', 'Name', 'Species', 'Contact', 'Visits', 'Spent', 'Active')
-        self.customer_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
+        self.customer_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=self.VISIBLE_ROWS)
         
         # Configure columns with proper spacing
         self.customer_tree.heading('ID', text='ID')
@@ -141,10 +148,12 @@ class CustomerWindow:
         self.customer_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.customer_tree.bind('<Double-1>', self._on_customer_select)
         
-        # Scrollbar for treeview
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.customer_tree.yview)
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.customer_tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar drives the row window rather than the Treeview's own view
+        self.customer_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._on_yscroll)
+        self.customer_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self._attach_row_window(self.customer_tree, self.customer_scrollbar)
+        # Only the visible rows exist in the Treeview, so paging and edge arrow keys move the row window
+        self._bind_row_keys()
         
         # Action buttons
         action_frame = ttk.Frame(list_frame)
@@ -153,63 +162,213 @@ class CustomerWindow:
         ttk.Button(action_frame, text="Edit Selected", command=self._edit_selected).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Delete Selected", command=self._delete_selected).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Refresh", command=self._load_customers).pack(side=tk.LEFT, padx=5)
+        
+        # Status label
+        self.status_label = ttk.Label(list_frame, text="", font=("Arial", 9), foreground="green")
+        self.status_label.grid(row=3, column=0, pady=5)
+    
+    def _on_close(self):
+        """Stop background work and close the window."""
+        if self._form_job is not None:
+            self.window.after_cancel(self._form_job)
+            self._form_job = None
+        if self._load_job is not None:
+            self.window.after_cancel(self._load_job)
+            self._load_job = None
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._cancel_refresh()
+        self._stop_background_tasks()
+        self.window.destroy()
     
     def _load_customers(self):
-        """Load all customers into the treeview."""
-        # Clear existing items
-        for item in self.customer_tree.get_children():
-            self.customer_tree.delete(item)
-        
-        # Get all customers
-        customers = self.db_manager.get_all(Customer)
-        
-        # Add to treeview
-        for customer in customers:
-            self.customer_tree.insert('', tk.END, values=(
-                customer.id,
-                customer.name,
-                customer.species,
-                customer.contact_info or '',
-                customer.total_visits,
-                f"${customer.total_spent:.2f}",
-                'Yes' if customer.is_active else 'No'
-            ))
+        """Fetch customers on the worker thread; rows are rendered when results arrive."""
+        self._load_job = None
+        self._load_generation += 1
+        self.status_label.config(text="Loading customers...")
+        self._run_in_background(
+            self._fetch_customers_data,
+            partial(self._on_customers_loaded, self._load_generation)
+        )
+    
+    def _fetch_customers_data(self) -> tuple:
+        """
+        Query the listed customer columns and build rows and a search index
+        (runs on the worker thread).
+        
+        Returns:
+            Tuple of (treeview rows, [(row, species, search key)])
+        """
+        rows = self._format_rows(self.db_manager.get_columns(Customer, self.LIST_FIELDS))
+        search_key = self._search_key
+        search_index = [(row, row[2], search_key(row)) for row in rows]
+        return rows, search_index
+    
+    def _on_customers_loaded(self, generation: int, data: Optional[tuple],
+                             error: Optional[Exception]):
+        """Show a finished load unless a newer one has been started since."""
+        if generation != self._load_generation:
+            return
+        self._rendered_generation = generation
+        self.status_label.config(text="")
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load customers: {error}")
+            return
+        self._display_rows, self._search_index = data
+        self._customers_by_id = {}
+        self._apply_filter()
     
     def _on_search(self, event=None):
-        """Handle search text change."""
-        search_text = self.search_entry.get().lower()
+        """Handle search text change, waiting until typing settles."""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        # Arrow, modifier and other keys fire <KeyRelease> without changing the text
+        if self.search_entry.get() == self._last_search_text:
+            return
+        self._search_after_id = self.window.after(300, self._run_search)
+    
+    def _run_search(self):
+        """Refresh the customer list for the current search text and species filter."""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._apply_filter()
+    
+    def _apply_filter(self, keep_position: bool = False):
+        """
+        Show the cached rows matching the search text and species filter.
+        
+        Args:
+            keep_position: Keep the current scroll position instead of returning to the top
+        """
+        self._last_search_text = self.search_entry.get()
+        search_text = self._last_search_text.lower()
         species_filter = self.species_filter.get()
         
-        # Clear treeview
-        for item in self.customer_tree.get_children():
-            self.customer_tree.delete(item)
+        entries = self._search_index
+        if species_filter != 'All':
+            entries = [entry for entry in entries if entry[1] == species_filter]
+        if search_text:
+            rows = [row for row, _, key in entries if search_text in key]
+        else:
+            rows = [entry[0] for entry in entries]
+        if keep_position:
+            self._rows = rows
+            self._refresh_visible()
+        else:
+            self._show_rows(rows)
+    
+    @staticmethod
+    def _format_rows(values: Iterable[tuple]) -> List[tuple]:
+        """Build treeview values from customers' LIST_FIELDS values in one pass."""
+        return [
+            (customer_id, name, species, contact_info or '', total_visits,
+             f"${total_spent:.2f}", 'Yes' if is_active else 'No')
+            for customer_id, name, species, contact_info, total_visits, total_spent, is_active in values
+        ]
+    
+    @staticmethod
+    def _search_key(row: tuple) -> str:
+        """Lowercase a row's name and contact info into one string searched with a single test."""
+        # The single-line search text cannot match across the newline between fields
+        return f"{row[1]}\n{row[3]}".lower()
+    
+    def _index_entry(self, customer: Customer) -> tuple:
+        """Build a customer's search index entry (row, species, search key)."""
+        row, = self._format_rows([self._list_values(customer)])
+        return row, customer.species, self._search_key(row)
+    
+    def _patch_customer_row(self, customer_id: int, customer: Optional[Customer]):
+        """
+        Apply a single-customer change to the list without reloading everything.
         
-        # Get all customers
-        if species_filter == 'All':
-            customers = self.db_manager.get_all(Customer)
+        Args:
+            customer_id: Id of the created, updated or deleted customer
+            customer: Customer as now stored, or None when it was deleted
+        """
+        if self._rendered_generation != self._load_generation:
+            # A load is still in flight. It was queued on the single worker after the
+            # task that made this change, so its results already include it.
+            return
+        position = next((i for i, row in enumerate(self._display_rows) if row[0] == customer_id), None)
+        if customer is None:
+            self._customers_by_id.pop(customer_id, None)
+            if position is not None:
+                del self._display_rows[position]
+                del self._search_index[position]
         else:
-            customers = self.db_manager.find(Customer, species=species_filter)
-        
-        # Filter by search text
-        for customer in customers:
-            if search_text in customer.name.lower() or \
-               (customer.contact_info and search_text in customer.contact_info.lower()):
-                self.customer_tree.insert('', tk.END, values=(
-                    customer.id,
-                    customer.name,
-                    customer.species,
-                    customer.contact_info or '',
-                    customer.total_visits,
-                    f"${customer.total_spent:.2f}",
-                    'Yes' if customer.is_active else 'No'
-                ))
+            self._customers_by_id[customer_id] = customer
+            entry = self._index_entry(customer)
+            if position is None:
+                # New ids are the largest, and rows are in id order
+                self._display_rows.append(entry[0])
+                self._search_index.append(entry)
+            else:
+                self._display_rows[position] = entry[0]
+                self._search_index[position] = entry
+        self._apply_filter(keep_position=True)
+    
+    def _show_rows(self, rows: List[tuple]):
+        """Make rows the listed rows and show the top of the list."""
+        self._rows = rows
+        self._first_row = 0
+        self._refresh_visible()
+    
+    def _row_count(self) -> int:
+        """Return the number of listed customers."""
+        return len(self._rows)
+    
+    def _window_rows(self, first: int, last: int) -> Dict[str, tuple]:
+        """Return the listed customers first to last as {iid: (values, tags)}, keyed by customer id."""
+        return {str(values[0]): (values, ()) for values in self._rows[first:last]}
     
     def _on_filter(self, event=None):
         """Handle species filter change."""
-        self._on_search()
+        self._run_search()
+    
+    def _ensure_form_built(self):
+        """Create the customer form's fields and buttons on first use."""
+        self._form_job = None
+        if self._form_built:
+            return
+        self._form_built = True
+        form_frame = self._form_frame
+        
+        # Form fields
+        ttk.Label(form_frame, text="Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.name_entry = ttk.Entry(form_frame, width=25)
+        self.name_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
+        
+        ttk.Label(form_frame, text="Species:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.species_entry = ttk.Entry(form_frame, width=25)
+        self.species_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
+        
+        ttk.Label(form_frame, text="Contact Info:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.contact_entry = ttk.Entry(form_frame, width=25)
+        self.contact_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
+        
+        ttk.Label(form_frame, text="Notes:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.notes_text = tk.Text(form_frame, width=25, height=5)
+        self.notes_text.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5, padx=(5, 0))
+        
+        self.is_active_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(form_frame, text="Active", variable=self.is_active_var).grid(
+            row=4, column=1, sticky=tk.W, pady=5, padx=(5, 0)
+        )
+        
+        # Form buttons
+        button_frame = ttk.Frame(form_frame)
+        button_frame.grid(row=5, column=0, columnspan=2, pady=10)
+        
+        ttk.Button(button_frame, text="Create New", command=self._create_customer).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Update", command=self._update_customer).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear", command=self._clear_form).pack(side=tk.LEFT, padx=5)
     
     def _clear_form(self):
         """Clear all form fields."""
+        self._ensure_form_built()
         self.name_entry.delete(0, tk.END)
         self.species_entry.delete(0, tk.END)
         self.contact_entry.delete(0, tk.END)
@@ -232,19 +391,27 @@ class CustomerWindow:
             return
         
         # Create customer
-        customer = self.db_manager.create(
-            Customer,
-            name=name,
-            species=species,
-            contact_info=self.contact_entry.get().strip() or None,
-            notes=self.notes_text.get('1.0', tk.END).strip() or None,
-            is_active=self.is_active_var.get()
+        self._run_in_background(
+            partial(
+                self.db_manager.create,
+                Customer,
+                name=name,
+                species=species,
+                contact_info=self.contact_entry.get().strip() or None,
+                notes=self.notes_text.get('1.0', tk.END).strip() or None,
+                is_active=self.is_active_var.get()
+            ),
+            partial(self._on_customer_created, name)
         )
-        
-        if customer:
+    
+    def _on_customer_created(self, name: str, customer: Optional[Customer], error: Optional[Exception]):
+        """Report a created customer and add its row."""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to create customer: {error}")
+        elif customer:
             messagebox.showinfo("Success", f"Customer '{name}' created successfully!")
             self._clear_form()
-            self._load_customers()
+            self._patch_customer_row(customer.id, customer)
         else:
             messagebox.showerror("Error", "Failed to create customer!")
     
@@ -266,20 +433,30 @@ class CustomerWindow:
             messagebox.showerror("Error", "Species is required!")
             return
         
-        # Update customer
-        success = self.db_manager.update(
-            self.current_customer,
-            name=name,
-            species=species,
-            contact_info=self.contact_entry.get().strip() or None,
-            notes=self.notes_text.get('1.0', tk.END).strip() or None,
-            is_active=self.is_active_var.get()
+        # Update customer; update() only changes the object once the commit succeeds
+        customer = self.current_customer
+        self._run_in_background(
+            partial(
+                self.db_manager.update,
+                customer,
+                name=name,
+                species=species,
+                contact_info=self.contact_entry.get().strip() or None,
+                notes=self.notes_text.get('1.0', tk.END).strip() or None,
+                is_active=self.is_active_var.get()
+            ),
+            partial(self._on_customer_updated, customer, name)
         )
-        
-        if success:
+    
+    def _on_customer_updated(self, customer: Customer, name: str, success: Optional[bool],
+                             error: Optional[Exception]):
+        """Report an updated customer and patch its row."""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to update customer: {error}")
+        elif success:
             messagebox.showinfo("Success", f"Customer '{name}' updated successfully!")
             self._clear_form()
-            self._load_customers()
+            self._patch_customer_row(customer.id, customer)
         else:
             messagebox.showerror("Error", "Failed to update customer!")
     
@@ -292,11 +469,7 @@ class CustomerWindow:
         item = self.customer_tree.item(selection[0])
         customer_id = item['values'][0]
         
-        # Load customer
-        customer = self.db_manager.get_by_id(Customer, customer_id)
-        if customer:
-            self.current_customer = customer
-            self._populate_form(customer)
+        self._load_selected_customer(customer_id)
     
     def _edit_selected(self):
         """Edit the selected customer."""
@@ -308,14 +481,37 @@ class CustomerWindow:
         item = self.customer_tree.item(selection[0])
         customer_id = item['values'][0]
         
-        # Load customer
-        customer = self.db_manager.get_by_id(Customer, customer_id)
+        self._load_selected_customer(customer_id)
+    
+    def _load_selected_customer(self, customer_id: int):
+        """Show a customer in the form, fetching it on the worker thread unless already loaded."""
+        self._select_generation += 1
+        customer = self._customers_by_id.get(customer_id)
+        if customer is not None:
+            self.current_customer = customer
+            self._populate_form(customer)
+            return
+        self._run_in_background(
+            partial(self.db_manager.get_by_id, Customer, customer_id),
+            partial(self._on_selected_customer_loaded, self._select_generation)
+        )
+    
+    def _on_selected_customer_loaded(self, generation: int, customer: Optional[Customer],
+                                     error: Optional[Exception]):
+        """Populate the form with the most recently selected customer."""
+        if generation != self._select_generation:
+            return
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load customer: {error}")
+            return
         if customer:
+            self._customers_by_id[customer.id] = customer
             self.current_customer = customer
             self._populate_form(customer)
     
     def _populate_form(self, customer: Customer):
         """Populate form fields with customer data."""
+        self._ensure_form_built()
         self.name_entry.delete(0, tk.END)
         self.name_entry.insert(0, customer.name)
         
@@ -348,13 +544,32 @@ class CustomerWindow:
             return
         
         # Load and delete customer
-        customer = self.db_manager.get_by_id(Customer, customer_id)
-        if customer:
-            success = self.db_manager.delete(customer)
-            if success:
-                messagebox.showinfo("Success", f"Customer '{customer_name}' deleted successfully!")
-                self._clear_form()
-                self._load_customers()
-            else:
-                messagebox.showerror("Error", "Failed to delete customer!")
+        self._run_in_background(
+            partial(self._delete_customer, customer_id, self._customers_by_id.get(customer_id)),
+            partial(self._on_customer_deleted, customer_id, customer_name)
+        )
+    
+    def _delete_customer(self, customer_id: int, customer: Optional[Customer]) -> Optional[bool]:
+        """
+        Delete a customer, fetching it first unless already loaded (runs on the worker thread).
+        
+        Returns:
+            None if the customer no longer exists, otherwise whether it was deleted
+        """
+        customer = customer or self.db_manager.get_by_id(Customer, customer_id)
+        if not customer:
+            return None
+        return self.db_manager.delete(customer)
+    
+    def _on_customer_deleted(self, customer_id: int, customer_name: str, success: Optional[bool],
+                             error: Optional[Exception]):
+        """Report a deleted customer and drop its row."""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to delete customer: {error}")
+        elif success:
+            messagebox.showinfo("Success", f"Customer '{customer_name}' deleted successfully!")
+            self._clear_form()
+            self._patch_customer_row(customer_id, None)
+        elif success is not None:
+            messagebox.showerror("Error", "Failed to delete customer!")
 
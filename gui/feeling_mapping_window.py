@@ -5,19 +5,29 @@ Allows customization of which services are recommended for each feeling.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, List
+from functools import cached_property, partial
+from typing import Optional, List, Dict, Iterable, FrozenSet, Set
 from database.db_manager import DatabaseManagement
 from models.feeling_service_mapping import FeelingServiceMapping
 from models.service import Service
 from services.mood_recommendation_service import MoodRecommendationService
+from gui.mixins import BackgroundTasksMixin, RowWindowMixin, service_display
 
 
-class FeelingMappingWindow:
+class FeelingMappingWindow(BackgroundTasksMixin, RowWindowMixin):
     """
     Window for managing feeling-to-service mappings.
     Allows customization of recommendations.
     """
     
+    # Mapping list rows are virtualized: only the visible slice is in the Treeview
+    ROW_HEIGHT = 40
+    VISIBLE_ROWS = 20
+    
+    # Active column text and row tags, by is_active
+    ACTIVE_TEXT = {True: "Yes", False: "No"}
+    ACTIVE_TAGS = {True: ("active",), False: ("inactive",)}
+    
     def __init__(self, parent: tk.Tk, db_manager: DatabaseManagement):
         """
         Initialize feeling mapping window.
@@ -28,24 +38,46 @@ class FeelingMappingWindow:
         """
         self.parent = parent
         self.db_manager = db_manager
-        self.mood_service = MoodRecommendationService(db_manager)
         self.current_feeling: Optional[str] = None
         self.current_mapping: Optional[FeelingServiceMapping] = None
         
+        # Services referenced by mappings, by id; every mapping sorted by (feeling, priority),
+        # or None until loaded; and the listed mappings by treeview iid
+        self._services_by_id: Dict[int, Service] = {}
+        self._all_mappings: Optional[List[FeelingServiceMapping]] = None
+        self._mapping_by_iid: Dict[str, FeelingServiceMapping] = {}
+        self._mapped_pairs: Set[tuple] = set()  # (feeling, service_id) of every loaded mapping
+        # (iid, (values, tags)) rows of the listed mappings and the visible window into them
+        self._rows: List[tuple] = []
+        self._init_row_window()
+        self._service_label_by_id: Dict[int, str] = {}  # Service combo labels of available services
+        self._view_feeling: Optional[str] = None  # Feeling the list is filtered to, None for all
+        
+        # Database work runs on one worker thread
+        self._init_background_tasks()
+        self._load_generation = 0
+        self._rendered_generation = 0
+        
         # Create main window
         self.window = tk.Toplevel(parent)
         self.window.title("Panda Spa - Feeling-Service Mapping Configuration")
         self.window.geometry("1000x700")
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self._create_widgets()
-        self._load_feelings()
-        self._load_services()
+        # Let the window draw before the combo boxes are filled in and the first load is started
+        self._load_job = self.window.after_idle(self._load_initial_data)
+    
+    @cached_property
+    def mood_service(self) -> MoodRecommendationService:
+        """Recommendation service, created on first use."""
+        return MoodRecommendationService(self.db_manager)
     
     def _create_widgets(self):
         """Create and layout all GUI widgets."""
         # Configure Treeview style
         style = ttk.Style()
-        style.configure("Treeview", rowheight=40)
+        style.configure("Treeview", rowheight=self.ROW_HEIGHT)
         style.configure("Treeview.Heading", font=('Arial', 10, 'bold'))
         
         # Main container
@@ -127,7 +159,7 @@ class FeelingMappingWindow:
         
         # Mappings list
         columns = ('Feeling', 'Service', 'Priority', 'Active')
-        self.mappings_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=20)
+        self.mappings_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=self.VISIBLE_ROWS)
         
         self.mappings_tree.heading('Feeling', text='Feeling')
         self.mappings_tree.heading('Service', text='Service Name')
@@ -139,18 +171,31 @@ class FeelingMappingWindow:
         self.mappings_tree.column('Priority', width=80, anchor=tk.CENTER)
         self.mappings_tree.column('Active', width=80, anchor=tk.CENTER)
         
+        # Row colours by active state
+        self.mappings_tree.tag_configure('active', foreground='green')
+        self.mappings_tree.tag_configure('inactive', foreground='gray')
+        
         self.mappings_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.mappings_tree.bind('<Double-1>', self._on_mapping_select)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.mappings_tree.yview)
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.mappings_tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar drives the row window rather than the Treeview's own view
+        self.mappings_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._on_yscroll)
+        self.mappings_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self._attach_row_window(self.mappings_tree, self.mappings_scrollbar)
+        # Only the visible rows exist in the Treeview, so paging and edge arrow keys move the row window
+        self._bind_row_keys()
         
         # Status label
         self.status_label = ttk.Label(list_frame, text="", font=("Arial", 9), foreground="green")
         self.status_label.grid(row=2, column=0, pady=5)
     
+    def _load_initial_data(self):
+        """Fill the feeling and service combo boxes and start loading mappings."""
+        self._load_job = None
+        self._load_feelings()
+        self._load_services()
+        self._load_mappings()
+    
     def _load_feelings(self):
         """Load available feelings into combo boxes."""
         feelings = self.mood_service.get_available_feelings()
@@ -160,36 +205,80 @@ class FeelingMappingWindow:
     def _load_services(self):
         """Load available services into combo box."""
         services = self.db_manager.find(Service, is_available=True)
-        service_list = [f"{s.id}: {s.name} (${s.price:.2f})" for s in services]
-        self.service_combo['values'] = service_list
+        # Seed the service cache so mapping loads only fetch services missing from the combo
+        self._services_by_id.update((service.id, service) for service in services)
+        self._service_label_by_id = {s.id: service_display(s) for s in services}
+        self.service_combo['values'] = list(self._service_label_by_id.values())
     
-    def _load_mappings(self):
-        """Load all mappings into treeview."""
-        for item in self.mappings_tree.get_children():
-            self.mappings_tree.delete(item)
-        
-        mappings = self.db_manager.get_all(FeelingServiceMapping)
-        mappings.sort(key=lambda m: (m.feeling, m.priority))
-        
-        for mapping in mappings:
-            service = self.db_manager.get_by_id(Service, mapping.service_id)
-            service_name = service.name if service else f"ID:{mapping.service_id}"
-            
-            active_text = "Yes" if mapping.is_active else "No"
-            tag = "active" if mapping.is_active else "inactive"
-            
-            self.mappings_tree.insert('', tk.END, values=(
-                mapping.feeling,
-                service_name,
-                mapping.priority,
-                active_text
-            ), tags=(tag,))
+    def _on_close(self):
+        """Stop background work and close the window."""
+        if self._load_job is not None:
+            self.window.after_cancel(self._load_job)
+            self._load_job = None
+        self._cancel_refresh()
+        self._stop_background_tasks()
+        self.window.destroy()
+    
+    def _load_mappings(self, keep_position: bool = False, feeling: Optional[str] = None):
+        """
+        Fetch mappings on the worker thread; rows are rendered when results arrive.
         
-        # Configure tags
-        self.mappings_tree.tag_configure('active', foreground='green')
-        self.mappings_tree.tag_configure('inactive', foreground='gray')
+        Args:
+            keep_position: Keep the current scroll position instead of returning to the top
+            feeling: Show only this feeling's mappings once loaded, or None for all
+        """
+        self._view_feeling = feeling
+        self._load_generation += 1
+        self.status_label.config(text="Loading mappings...")
+        self._run_in_background(
+            partial(self._fetch_mappings_data, frozenset(self._services_by_id)),
+            partial(self._on_mappings_loaded, self._load_generation, keep_position)
+        )
+    
+    def _fetch_mappings_data(self, known_service_ids: FrozenSet[int]) -> tuple:
+        """
+        Query all mappings and the services they reference (runs on the worker thread).
+        
+        Args:
+            known_service_ids: Ids already in the service cache, which are not fetched again
+        
+        Returns:
+            Tuple of (mappings sorted by feeling then priority, newly fetched services by id)
+        """
+        mappings = self.db_manager.get_all(FeelingServiceMapping, order_by=('feeling', 'priority'))
+        missing = {mapping.service_id for mapping in mappings}.difference(known_service_ids)
+        services = self.db_manager.get_by_ids(Service, missing) if missing else {}
+        return mappings, services
+    
+    def _on_mappings_loaded(self, generation: int, keep_position: bool, data: Optional[tuple],
+                            error: Optional[Exception]):
+        """Show a finished load unless a newer one has been started since."""
+        if generation != self._load_generation:
+            return
+        self._rendered_generation = generation
+        if error is not None:
+            self.status_label.config(text="")
+            messagebox.showerror("Error", f"Failed to load mappings: {error}")
+            return
+        mappings, services = data
+        self._services_by_id.update(services)
+        self._all_mappings = mappings
+        self._mapped_pairs = {(mapping.feeling, mapping.service_id) for mapping in mappings}
         
-        self.status_label.config(text=f"Total mappings: {len(mappings)}")
+        self._show_view(keep_position)
+    
+    def _show_view(self, keep_position: bool = False):
+        """List the loaded mappings for the current feeling filter."""
+        feeling = self._view_feeling
+        if feeling is None:
+            self._show_mappings(self._all_mappings, keep_position)
+            self.status_label.config(text=f"Total mappings: {len(self._all_mappings)}")
+            return
+        
+        # The cached list is sorted by (feeling, priority), so each feeling's mappings stay in priority order
+        mappings = [mapping for mapping in self._all_mappings if mapping.feeling == feeling]
+        self._show_mappings(mappings, keep_position)
+        self.status_label.config(text=f"Mappings for '{feeling}': {len(mappings)}")
     
     def _filter_mappings(self, event=None):
         """Filter mappings by feeling."""
@@ -198,27 +287,60 @@ class FeelingMappingWindow:
             self._load_mappings()
             return
         
-        for item in self.mappings_tree.get_children():
-            self.mappings_tree.delete(item)
+        if self._all_mappings is None:
+            self._load_mappings(feeling=feeling)
+            return
         
-        mappings = self.db_manager.find(FeelingServiceMapping, feeling=feeling)
-        mappings.sort(key=lambda m: m.priority)
+        self._view_feeling = feeling
+        if self._rendered_generation == self._load_generation:
+            self._show_view()
+        # Otherwise the load in flight shows this feeling when it arrives
+    
+    def _show_mappings(self, mappings: List[FeelingServiceMapping], keep_position: bool = False):
+        """
+        Make the given mappings the listed rows.
         
-        for mapping in mappings:
-            service = self.db_manager.get_by_id(Service, mapping.service_id)
-            service_name = service.name if service else f"ID:{mapping.service_id}"
-            
-            active_text = "Yes" if mapping.is_active else "No"
-            tag = "active" if mapping.is_active else "inactive"
-            
-            self.mappings_tree.insert('', tk.END, values=(
+        Args:
+            mappings: Mappings to list, in display order
+            keep_position: Keep the current scroll position instead of returning to the top
+        """
+        self._mapping_by_iid = {str(mapping.id): mapping for mapping in mappings}
+        services_by_id = self._get_services(mapping.service_id for mapping in mappings)
+        service_names = {service_id: service.name for service_id, service in services_by_id.items()}
+        active_text, active_tags = self.ACTIVE_TEXT, self.ACTIVE_TAGS
+        self._rows = [
+            (str(mapping.id), ((
                 mapping.feeling,
-                service_name,
+                service_names[mapping.service_id] if mapping.service_id in service_names
+                else f"ID:{mapping.service_id}",
                 mapping.priority,
-                active_text
-            ), tags=(tag,))
+                active_text[mapping.is_active]
+            ), active_tags[mapping.is_active]))
+            for mapping in mappings
+        ]
+        if not keep_position:
+            self._first_row = 0
+        self._refresh_visible()
+    
+    def _row_count(self) -> int:
+        """Return the number of listed mappings."""
+        return len(self._rows)
+    
+    def _window_rows(self, first: int, last: int) -> Dict[str, tuple]:
+        """Return the listed mappings first to last as {iid: (values, tags)}."""
+        return dict(self._rows[first:last])
+    
+    def _get_services(self, service_ids: Iterable[int]) -> Dict[int, Service]:
+        """
+        Get services by id, fetching only those not already cached in one query.
         
-        self.status_label.config(text=f"Mappings for '{feeling}': {len(mappings)}")
+        Returns:
+            The service cache, keyed by id
+        """
+        missing = set(service_ids).difference(self._services_by_id)
+        if missing:
+            self._services_by_id.update(self.db_manager.get_by_ids(Service, missing))
+        return self._services_by_id
     
     def _on_feeling_select(self, event=None):
         """Handle feeling selection."""
@@ -231,18 +353,10 @@ class FeelingMappingWindow:
         if not selection:
             return
         
-        item = self.mappings_tree.item(selection[0])
-        feeling = item['values'][0]
-        service_name = item['values'][1]
-        
-        # Find the mapping
-        mappings = self.db_manager.find(FeelingServiceMapping, feeling=feeling)
-        for mapping in mappings:
-            service = self.db_manager.get_by_id(Service, mapping.service_id)
-            if service and service.name == service_name:
-                self.current_mapping = mapping
-                self._load_mapping_to_form()
-                break
+        mapping = self._mapping_by_iid.get(selection[0])
+        if mapping:
+            self.current_mapping = mapping
+            self._load_mapping_to_form()
     
     def _load_mapping_to_form(self):
         """Load selected mapping into form."""
@@ -250,9 +364,13 @@ class FeelingMappingWindow:
             return
         
         self.feeling_combo.set(self.current_mapping.feeling)
-        service = self.db_manager.get_by_id(Service, self.current_mapping.service_id)
-        if service:
-            service_str = f"{service.id}: {service.name} (${service.price:.2f})"
+        service_id = self.current_mapping.service_id
+        service_str = self._service_label_by_id.get(service_id)
+        if service_str is None:
+            # Unavailable services are not in the combo but can still be mapped
+            service = self._get_services([service_id]).get(service_id)
+            service_str = service_display(service) if service else None
+        if service_str:
             self.service_combo.set(service_str)
         
         self.priority_entry.delete(0, tk.END)
@@ -260,53 +378,88 @@ class FeelingMappingWindow:
         
         self.is_active_var.set(self.current_mapping.is_active)
     
+    def _read_priority(self) -> Optional[int]:
+        """
+        Read the priority entry, reporting anything that is not a whole number.
+        
+        Returns:
+            The entered priority, or None if it was rejected
+        """
+        raw = self.priority_entry.get().strip()
+        digits = raw[1:] if raw[:1] in ('+', '-') else raw
+        if not digits.isdecimal():
+            messagebox.showerror("Error", "Invalid priority value! Please enter a number.")
+            return None
+        return int(raw)
+    
     def _add_mapping(self):
         """Add a new feeling-service mapping."""
-        try:
-            feeling = self.feeling_combo.get()
-            if not feeling:
-                messagebox.showerror("Error", "Please select a feeling!")
-                return
-            
-            if not self.service_combo.get():
-                messagebox.showerror("Error", "Please select a service!")
-                return
-            
-            service_id = int(self.service_combo.get().split(':')[0])
-            priority = int(self.priority_entry.get())
-            is_active = self.is_active_var.get()
-            
-            # Check if mapping already exists
-            existing = self.db_manager.find_one(
-                FeelingServiceMapping,
-                feeling=feeling,
-                service_id=service_id
-            )
-            
-            if existing:
-                messagebox.showwarning("Warning", "This mapping already exists! Use 'Update Mapping' to modify it.")
-                return
-            
-            # Create new mapping
-            mapping = FeelingServiceMapping(
-                feeling=feeling,
-                service_id=service_id,
-                priority=priority,
-                is_active=is_active
-            )
-            
-            success = self.db_manager.save(mapping)
-            if success:
-                messagebox.showinfo("Success", f"Mapping added: {feeling} → Service")
-                self._clear_form()
-                self._load_mappings()
-            else:
-                messagebox.showerror("Error", "Failed to save mapping")
-                
-        except ValueError:
-            messagebox.showerror("Error", "Invalid priority value! Please enter a number.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to add mapping: {e}")
+        feeling = self.feeling_combo.get()
+        if not feeling:
+            messagebox.showerror("Error", "Please select a feeling!")
+            return
+        
+        if not self.service_combo.get():
+            messagebox.showerror("Error", "Please select a service!")
+            return
+        
+        priority = self._read_priority()
+        if priority is None:
+            return
+        service_id = int(self.service_combo.get().partition(':')[0])
+        is_active = self.is_active_var.get()
+        
+        # Pairs already in the loaded list need no database round trip
+        if (feeling, service_id) in self._mapped_pairs:
+            messagebox.showwarning("Warning", "This mapping already exists! Use 'Update Mapping' to modify it.")
+            return
+        
+        self._run_in_background(
+            partial(self._save_new_mapping, feeling, service_id, priority, is_active),
+            partial(self._on_mapping_added, feeling)
+        )
+    
+    def _save_new_mapping(self, feeling: str, service_id: int, priority: int,
+                          is_active: bool) -> Optional[bool]:
+        """
+        Save a new mapping unless the pair is already mapped (runs on the worker thread).
+        
+        Returns:
+            None if the mapping already exists, otherwise whether it was saved
+        """
+        # Check if mapping already exists
+        if self.db_manager.exists(FeelingServiceMapping, feeling=feeling, service_id=service_id):
+            return None
+        
+        # Create new mapping
+        mapping = FeelingServiceMapping(
+            feeling=feeling,
+            service_id=service_id,
+            priority=priority,
+            is_active=is_active
+        )
+        return self.db_manager.save(mapping)
+    
+    def _on_mapping_added(self, feeling: str, success: Optional[bool], error: Optional[Exception]):
+        """Report an added mapping and reload the list."""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to add mapping: {error}")
+        elif success is None:
+            messagebox.showwarning("Warning", "This mapping already exists! Use 'Update Mapping' to modify it.")
+        elif success:
+            messagebox.showinfo("Success", f"Mapping added: {feeling} → Service")
+            self._clear_form()
+            self._reload_after_change()
+        else:
+            messagebox.showerror("Error", "Failed to save mapping")
+    
+    def _reload_after_change(self):
+        """Drop cached mappings and reload every mapping in place; mapping edits leave services cached."""
+        # Open windows memoize recommendations built from the mappings
+        MoodRecommendationService.notify_data_changed()
+        self._all_mappings = None
+        self._mapped_pairs = set()
+        self._load_mappings(keep_position=True)
     
     def _update_mapping(self):
         """Update existing mapping."""
@@ -314,38 +467,38 @@ class FeelingMappingWindow:
             messagebox.showwarning("Warning", "Please select a mapping to update!")
             return
         
-        try:
-            feeling = self.feeling_combo.get()
-            if not feeling:
-                messagebox.showerror("Error", "Please select a feeling!")
-                return
-            
-            if not self.service_combo.get():
-                messagebox.showerror("Error", "Please select a service!")
-                return
-            
-            service_id = int(self.service_combo.get().split(':')[0])
-            priority = int(self.priority_entry.get())
-            is_active = self.is_active_var.get()
-            
-            # Update mapping
-            self.current_mapping.feeling = feeling
-            self.current_mapping.service_id = service_id
-            self.current_mapping.priority = priority
-            self.current_mapping.is_active = is_active
-            
-            success = self.db_manager.save(self.current_mapping)
-            if success:
-                messagebox.showinfo("Success", "Mapping updated successfully!")
-                self._clear_form()
-                self._load_mappings()
-            else:
-                messagebox.showerror("Error", "Failed to update mapping")
-                
-        except ValueError:
-            messagebox.showerror("Error", "Invalid priority value! Please enter a number.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to update mapping: {e}")
+        feeling = self.feeling_combo.get()
+        if not feeling:
+            messagebox.showerror("Error", "Please select a feeling!")
+            return
+        
+        if not self.service_combo.get():
+            messagebox.showerror("Error", "Please select a service!")
+            return
+        
+        priority = self._read_priority()
+        if priority is None:
+            return
+        service_id = int(self.service_combo.get().partition(':')[0])
+        is_active = self.is_active_var.get()
+        
+        # Update mapping; the cached object only takes the new values once they are committed
+        self._run_in_background(
+            partial(self.db_manager.update, self.current_mapping, feeling=feeling,
+                    service_id=service_id, priority=priority, is_active=is_active),
+            self._on_mapping_updated
+        )
+    
+    def _on_mapping_updated(self, success: Optional[bool], error: Optional[Exception]):
+        """Report an updated mapping and reload the list."""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to update mapping: {error}")
+        elif success:
+            messagebox.showinfo("Success", "Mapping updated successfully!")
+            self._clear_form()
+            self._reload_after_change()
+        else:
+            messagebox.showerror("Error", "Failed to update mapping")
     
     def _delete_mapping(self):
         """Delete selected mapping."""
@@ -356,13 +509,19 @@ class FeelingMappingWindow:
         if not messagebox.askyesno("Confirm", "Are you sure you want to delete this mapping?"):
             return
         
-        try:
-            self.db_manager.delete(self.current_mapping)
+        self._run_in_background(partial(self.db_manager.delete, self.current_mapping),
+                                self._on_mapping_deleted)
+    
+    def _on_mapping_deleted(self, success: Optional[bool], error: Optional[Exception]):
+        """Report a deleted mapping and reload the list."""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to delete mapping: {error}")
+        elif success:
             messagebox.showinfo("Success", "Mapping deleted successfully!")
             self._clear_form()
-            self._load_mappings()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete mapping: {e}")
+            self._reload_after_change()
+        else:
+            messagebox.showerror("Error", "Failed to delete mapping")
     
     def _clear_form(self):
         """Clear the form."""
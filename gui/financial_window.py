@@ -278,6 +278,20 @@ class FinancialWindow:
         self.supplier_combo['values'] = supplier_list
         self.supplier_combo.set('None')
     
+    @staticmethod
+    def _parse_date(date_str: str) -> Optional[datetime]:
+        """Parse a "YYYY-MM-DD" entry into a midnight datetime, or None when empty."""
+        if not date_str:
+            return None
+        # fromisoformat also takes "20261015" and week dates; only use it for the exact entry shape
+        if len(date_str) == 10 and date_str[4] + date_str[7] == '--':
+            try:
+                return datetime.combine(date.fromisoformat(date_str), datetime.min.time())
+            except ValueError:
+                pass
+        # Slower path for other inputs, e.g. single-digit months
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    
     def _update_dashboard(self):
         """Update financial dashboard with current data."""
         try:
@@ -285,8 +299,8 @@ class FinancialWindow:
             start_date_str = self.start_date_entry.get()
             end_date_str = self.end_date_entry.get()
             
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d') if start_date_str else None
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d') if end_date_str else None
+            start_date = self._parse_date(start_date_str)
+            end_date = self._parse_date(end_date_str)
             if end_date:
                 # Set to end of day
                 end_date = end_date.replace(hour=23, minute=59, second=59)
@@ -347,8 +361,8 @@ class FinancialWindow:
                 if supplier:
                     supplier_name = supplier.name
             
-            # Format date
-            date_str = record.transaction_date.strftime('%Y-%m-%d %H:%M')
+            # Format date (isoformat is considerably cheaper than strftime)
+            date_str = record.transaction_date.isoformat(sep=' ', timespec='minutes')
             
             # Format type
             type_display = record.transaction_type.title()
@@ -403,7 +417,7 @@ class FinancialWindow:
         supplier_str = self.supplier_combo.get()
         if supplier_str and supplier_str != 'None':
             try:
-                supplier_id = int(supplier_str.split(':')[0])
+                supplier_id = int(supplier_str.partition(':')[0])
             except (ValueError, IndexError):
                 pass
         
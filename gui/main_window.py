@@ -9,7 +9,7 @@ from datetime import datetime, date, timedelta
 from database.db_manager import DatabaseManagement
 from gui.customer_window import CustomerWindow
 from gui.service_window import ServiceWindow
-from gui.appointment_window import AppointmentWindow
+from gui.appointment_window import AppointmentWindow, STATUS_DISPLAY
 from gui.financial_window import FinancialWindow
 from gui.recommendation_window import RecommendationWindow
 from gui.feeling_mapping_window import FeelingMappingWindow
@@ -224,11 +224,10 @@ class MainWindow:
         start_of_day = datetime.combine(today, datetime.min.time())
         end_of_day = datetime.combine(today, datetime.max.time())
         
-        all_appointments = self.db_manager.get_all(Appointment)
-        today_appointments = [
-            apt for apt in all_appointments
-            if start_of_day <= apt.appointment_datetime <= end_of_day
-        ]
+        # Filtered and sorted by time in SQL
+        today_appointments = self.db_manager.find_in_range(
+            Appointment, "appointment_datetime", start_of_day, end_of_day
+        )
         
         self.stats_cards['appointments'].config(text=str(len(today_appointments)))
         
@@ -240,17 +239,20 @@ class MainWindow:
         for item in self.appointments_tree.get_children():
             self.appointments_tree.delete(item)
         
-        # Sort appointments by time
-        today_appointments.sort(key=lambda x: x.appointment_datetime)
+        shown = today_appointments[:10]  # Show up to 10
+        
+        # One query each for the customers and services of the shown rows
+        customers_by_id = self.db_manager.get_by_ids(Customer, (a.customer_id for a in shown))
+        services_by_id = self.db_manager.get_by_ids(Service, (a.service_id for a in shown))
         
-        for appointment in today_appointments[:10]:  # Show up to 10
-            customer = self.db_manager.get_by_id(Customer, appointment.customer_id)
-            service = self.db_manager.get_by_id(Service, appointment.service_id)
+        for appointment in shown:
+            customer = customers_by_id.get(appointment.customer_id)
+            service = services_by_id.get(appointment.service_id)
             
             customer_name = customer.name if customer else f"ID:{appointment.customer_id}"
             service_name = service.name if service else f"ID:{appointment.service_id}"
-            time_str = appointment.appointment_datetime.strftime('%H:%M')
-            status_display = appointment.status.replace('_', ' ').title()
+            time_str = appointment.appointment_datetime.isoformat(timespec='minutes')[11:]
+            status_display = STATUS_DISPLAY.get(appointment.status) or appointment.status.replace('_', ' ').title()
             
             # Color code by status
             tag = appointment.status
@@ -0,0 +1,265 @@
+"""
+Shared behaviour for Panda Spa windows.
+Background database work, virtualized Treeview lists and combobox labels.
+"""
+
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Dict
+from models.service import Service
+
+
+def service_display(service: Service) -> str:
+    """Format a service as its combobox string."""
+    return f"{service.id}: {service.name} (${service.price:.2f})"
+
+
+class BackgroundTasksMixin:
+    """
+    Runs database work on one worker thread and hands results back on the Tk thread.
+    
+    Windows provide self.window, call _init_background_tasks() before scheduling
+    work and _stop_background_tasks() when they close.
+    """
+    
+    def _init_background_tasks(self):
+        """Create the worker thread and the queue that (callback, result, error) come back through."""
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._pending_tasks = 0
+        self._drain_job = None
+    
+    def _run_in_background(self, work: Callable[[], Any],
+                           on_done: Callable[[Any, Optional[Exception]], None]):
+        """
+        Run database work on the worker thread and deliver its outcome on the Tk thread.
+        
+        Args:
+            work: Callable run on the worker thread
+            on_done: Called on the Tk thread with (result, None) or (None, exception)
+        """
+        self._pending_tasks += 1
+        self._io_pool.submit(self._run_task, work, on_done)
+        self._schedule_drain()
+    
+    def _run_task(self, work: Callable[[], Any], on_done: Callable[[Any, Optional[Exception]], None]):
+        """Run a submitted task and queue its outcome (runs on the worker thread)."""
+        try:
+            self._ui_queue.put((on_done, work(), None))
+        except Exception as e:
+            self._ui_queue.put((on_done, None, e))
+    
+    def _schedule_drain(self):
+        """Poll the result queue from the Tk main loop while tasks are outstanding."""
+        if self._drain_job is None:
+            self._drain_job = self.window.after(50, self._drain_queue)
+    
+    def _drain_queue(self):
+        """Hand finished task results to their callbacks on the main thread."""
+        self._drain_job = None
+        try:
+            while True:
+                try:
+                    on_done, result, error = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending_tasks -= 1
+                on_done(result, error)
+        finally:
+            # A failing callback must not strand the results still queued behind it
+            if self._pending_tasks:
+                self._schedule_drain()
+    
+    def _stop_background_tasks(self):
+        """Stop polling for results and let the worker thread finish without waiting for it."""
+        if self._drain_job is not None:
+            self.window.after_cancel(self._drain_job)
+            self._drain_job = None
+        self._io_pool.shutdown(wait=False)
+
+
+class RowWindowMixin:
+    """
+    Virtualized Treeview list: only the rows inside the visible window are in the tree.
+    
+    Windows set ROW_HEIGHT and VISIBLE_ROWS, call _init_row_window() in __init__
+    and _attach_row_window() once the tree and its scrollbar exist (the scrollbar's
+    command is _on_yscroll), and implement _row_count() and _window_rows().
+    """
+    
+    # Height allowed for the heading strip until a rendered row can be measured
+    HEADING_HEIGHT = 30
+    
+    def _init_row_window(self):
+        """Start with the window at the top of an empty list."""
+        self._first_row = 0
+        self._visible_rows = self.VISIBLE_ROWS
+        self._tree_rows: Dict[str, tuple] = {}  # (values, tags) currently in the treeview, by iid
+        self._refresh_job = None
+        self._row_tree = None
+        self._row_scrollbar = None
+    
+    def _attach_row_window(self, tree, scrollbar):
+        """
+        Drive a treeview and its scrollbar from the row window.
+        
+        Args:
+            tree: Treeview that shows the visible rows
+            scrollbar: Scrollbar whose command is _on_yscroll
+        """
+        self._row_tree = tree
+        self._row_scrollbar = scrollbar
+        tree.bind('<Configure>', self._on_tree_configure)
+        tree.bind('<MouseWheel>', self._on_tree_mousewheel)
+        tree.bind('<Button-4>', self._on_tree_mousewheel)
+        tree.bind('<Button-5>', self._on_tree_mousewheel)
+    
+    def _bind_row_keys(self):
+        """Let the keyboard reach rows outside the visible window."""
+        tree = self._row_tree
+        for key in ('<Prior>', '<Next>', '<Home>', '<End>'):
+            tree.bind(key, self._on_tree_page_key)
+        tree.bind('<Up>', self._on_tree_arrow_key)
+        tree.bind('<Down>', self._on_tree_arrow_key)
+    
+    def _row_count(self) -> int:
+        """Return the number of rows in the list."""
+        raise NotImplementedError
+    
+    def _window_rows(self, first: int, last: int) -> Dict[str, tuple]:
+        """Return rows first to last (exclusive) in display order as {iid: (values, tags)}."""
+        raise NotImplementedError
+    
+    def _schedule_refresh(self):
+        """Refresh the visible rows once the Tk loop is idle, coalescing repeated requests."""
+        if self._refresh_job is None:
+            self._refresh_job = self.window.after_idle(self._refresh_visible)
+    
+    def _cancel_refresh(self):
+        """Drop a scheduled refresh."""
+        if self._refresh_job is not None:
+            self.window.after_cancel(self._refresh_job)
+            self._refresh_job = None
+    
+    def _refresh_visible(self):
+        """
+        Bring the treeview in line with the rows inside the visible window.
+        
+        Rows are keyed by iid, so only rows that scrolled in or out,
+        or whose values changed, are touched.
+        """
+        self._refresh_job = None
+        total = self._row_count()
+        self._first_row = max(0, min(self._first_row, total - self._visible_rows))
+        first = self._first_row
+        last = min(first + self._visible_rows, total)
+        
+        tree = self._row_tree
+        wanted = self._window_rows(first, last)
+        rendered = self._tree_rows
+        # Kept rows normally stay in order; if one moved (e.g. re-sorted after an edit), rebuild
+        kept = [iid for iid in tree.get_children() if iid in wanted]
+        if kept != [iid for iid in wanted if iid in rendered]:
+            removed = list(rendered)
+            rendered = {}
+        else:
+            removed = [iid for iid in rendered if iid not in wanted]
+        if removed:
+            tree.delete(*removed)
+        
+        # Hide the columns while inserting so Tk lays the rows out once
+        tree.configure(displaycolumns=())
+        for index, (iid, row) in enumerate(wanted.items()):
+            current = rendered.get(iid)
+            if current is None:
+                tree.insert('', index, iid=iid, values=row[0], tags=row[1])
+            elif current != row:
+                tree.item(iid, values=row[0], tags=row[1])
+        tree.configure(displaycolumns='#all')
+        self._tree_rows = wanted
+        
+        if total:
+            self._row_scrollbar.set(first / total, last / total)
+        else:
+            self._row_scrollbar.set(0.0, 1.0)
+    
+    def _scroll_to(self, first: int):
+        """Move the visible window and schedule a single refresh for it."""
+        first = max(0, min(first, self._row_count() - self._visible_rows))
+        if first == self._first_row:
+            return
+        self._first_row = first
+        # Coalesce bursts of scroll events into one refresh
+        self._schedule_refresh()
+    
+    def _on_yscroll(self, action, amount, unit=None):
+        """Handle scrollbar drags and clicks."""
+        if action == tk.MOVETO:
+            self._scroll_to(int(float(amount) * self._row_count()))
+        elif action == tk.SCROLL:
+            step = self._visible_rows if unit == tk.PAGES else 1
+            self._scroll_to(self._first_row + int(amount) * step)
+    
+    def _on_tree_mousewheel(self, event):
+        """Scroll the visible window with the mouse wheel."""
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        elif event.delta == 0:
+            return "break"
+        else:
+            # macOS and precision touchpads send deltas well below one 120-unit notch
+            steps = max(1, abs(event.delta) // 120)
+            delta = -steps if event.delta > 0 else steps
+        self._scroll_to(self._first_row + delta)
+        return "break"
+    
+    def _on_tree_page_key(self, event):
+        """Scroll the visible window with Page Up/Down, Home and End."""
+        if event.keysym == 'Home':
+            self._scroll_to(0)
+        elif event.keysym == 'End':
+            self._scroll_to(self._row_count())
+        elif event.keysym == 'Prior':
+            self._scroll_to(self._first_row - self._visible_rows)
+        else:
+            self._scroll_to(self._first_row + self._visible_rows)
+        return "break"
+    
+    def _on_tree_arrow_key(self, event):
+        """Scroll by one row when Up/Down leaves the first or last rendered row."""
+        tree = self._row_tree
+        children = tree.get_children()
+        if not children:
+            return None
+        step = -1 if event.keysym == 'Up' else 1
+        if tree.focus() != children[0 if step < 0 else -1]:
+            return None  # Tk moves the focus within the rendered rows
+        
+        target = self._first_row + (0 if step < 0 else len(children) - 1) + step
+        if not 0 <= target < self._row_count():
+            return "break"
+        # Render the new window now so the row the focus moves to exists
+        self._first_row = max(0, min(self._first_row + step, self._row_count() - self._visible_rows))
+        self._cancel_refresh()
+        self._refresh_visible()
+        iid = next(iter(self._window_rows(target, target + 1)))
+        tree.focus(iid)
+        tree.selection_set(iid)
+        return "break"
+    
+    def _on_tree_configure(self, event):
+        """Resize the visible window when the treeview changes height."""
+        visible_rows = max(1, (event.height - self._heading_height()) // self.ROW_HEIGHT)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._schedule_refresh()
+    
+    def _heading_height(self) -> int:
+        """Return the height above the first row, measured from a rendered row when possible."""
+        children = self._row_tree.get_children()
+        bbox = self._row_tree.bbox(children[0]) if children else None
+        # bbox is empty while the row is not mapped yet
+        return bbox[1] if bbox else self.HEADING_HEIGHT
@@ -173,12 +173,13 @@ class RecommendationWindow:
         for item in self.recommendations_tree.get_children():
             self.recommendations_tree.delete(item)
         
-        if not self.customer_combo.get():
+        customer_str = self.customer_combo.get()
+        if not customer_str:
             self.status_label.config(text="Please select a customer to see recommendations.", foreground="orange")
             return
         
         try:
-            customer_id = int(self.customer_combo.get().split(':')[0])
+            customer_id = int(customer_str.partition(':')[0])
             self.current_customer = self.db_manager.get_by_id(Customer, customer_id)
             
             if not self.current_customer:
@@ -254,7 +255,7 @@ class RecommendationWindow:
         for pref in sorted_prefs:
             service = self.db_manager.get_by_id(Service, pref.service_id)
             if service:
-                last_visit_str = pref.last_visited.strftime('%Y-%m-%d') if pref.last_visited else 'Never'
+                last_visit_str = pref.last_visited.date().isoformat() if pref.last_visited else 'Never'
                 
                 # Color code by score
                 tag = 'high_score' if pref.preference_score >= 5.0 else 'medium_score' if pref.preference_score >= 2.0 else 'low_score'
@@ -8,6 +8,7 @@ from tkinter import ttk, messagebox
 from typing import Optional
 from database.db_manager import DatabaseManagement
 from models.service import Service
+from services.mood_recommendation_service import MoodRecommendationService
 
 
 class ServiceWindow:
@@ -27,11 +28,14 @@ class ServiceWindow:
         self.parent = parent
         self.db_manager = db_manager
         self.current_service: Optional[Service] = None
+        self._search_after_id = None  # Pending debounced search
+        self._last_search_text = ''  # Search text the list currently reflects
         
         # Create main window
         self.window = tk.Toplevel(parent)
         self.window.title("Panda Spa - Service Management")
         self.window.geometry("1000x700")
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self._create_widgets()
         self._load_services()
@@ -162,6 +166,7 @@ class ServiceWindow:
     
     def _load_services(self):
         """Load all services into the treeview."""
+        self._last_search_text = ''  # The unfiltered list matches an empty search
         # Clear existing items
         for item in self.service_tree.get_children():
             self.service_tree.delete(item)
@@ -185,9 +190,30 @@ class ServiceWindow:
                 f"{service.popularity_score:.1f}"
             ))
     
+    def _on_close(self):
+        """Drop a pending search and close the window."""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self.window.destroy()
+    
     def _on_search(self, event=None):
-        """Handle search text change."""
-        search_text = self.search_entry.get().lower()
+        """Handle search text change, waiting until typing settles."""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        # Arrow, modifier and other keys fire <KeyRelease> without changing the text
+        if self.search_entry.get() == self._last_search_text:
+            return
+        self._search_after_id = self.window.after(300, self._run_search)
+    
+    def _run_search(self):
+        """Refresh the service list for the current search text and type filter."""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._last_search_text = self.search_entry.get()
+        search_text = self._last_search_text.lower()
         type_filter = self.type_filter.get()
         
         # Clear treeview
@@ -218,7 +244,7 @@ class ServiceWindow:
     
     def _on_filter(self, event=None):
         """Handle type filter change."""
-        self._on_search()
+        self._run_search()
     
     def _clear_form(self):
         """Clear all form fields."""
@@ -286,6 +312,7 @@ class ServiceWindow:
         )
         
         if service:
+            MoodRecommendationService.notify_data_changed()
             messagebox.showinfo("Success", f"Service '{name}' created successfully!")
             self._clear_form()
             self._load_services()
@@ -350,6 +377,7 @@ class ServiceWindow:
         )
         
         if success:
+            MoodRecommendationService.notify_data_changed()
             messagebox.showinfo("Success", f"Service '{name}' updated successfully!")
             self._clear_form()
             self._load_services()
@@ -426,6 +454,7 @@ class ServiceWindow:
             new_status = not service.is_available
             success = self.db_manager.update(service, is_available=new_status)
             if success:
+                MoodRecommendationService.notify_data_changed()
                 status_text = "available" if new_status else "unavailable"
                 messagebox.showinfo("Success", f"Service '{service_name}' is now {status_text}!")
                 self._load_services()
@@ -452,6 +481,7 @@ class ServiceWindow:
         if service:
             success = self.db_manager.delete(service)
             if success:
+                MoodRecommendationService.notify_data_changed()
                 messagebox.showinfo("Success", f"Service '{service_name}' deleted successfully!")
                 self._clear_form()
                 self._load_services()
@@ -4,7 +4,7 @@ Represents bookings made by customers for services.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from database.base import Base
@@ -66,6 +66,13 @@ class Appointment(Base):
     service = relationship("Service", backref="appointments")
     extras = relationship("Extra", secondary=appointment_extra_association, backref="appointments")
     
+    # Indexes for status and date-range queries
+    __table_args__ = (
+        Index('ix_appointments_status_datetime', 'status', 'appointment_datetime'),
+        Index('ix_appointments_datetime', 'appointment_datetime'),
+        Index('ix_appointments_service_status_datetime', 'service_id', 'status', 'appointment_datetime'),
+    )
+    
     def __init__(self, customer_id: int, service_id: int, appointment_datetime: datetime,
                  duration_minutes: int = None, price_paid: float = None, notes: str = None,
                  status: str = STATUS_SCHEDULED, customer_feeling: str = None):
@@ -4,7 +4,7 @@ Represents forest animals visiting the spa.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 
 from database.base import Base
@@ -47,6 +47,11 @@ class Customer(Base):
     notes = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     
+    # Index for the customer list's species filter
+    __table_args__ = (
+        Index('ix_customers_species', 'species'),
+    )
+    
     # Relationships (backrefs are defined in Appointment model)
     # appointments - backref from Appointment
     # preferences - will be added when CustomerPreference model is created
@@ -5,8 +5,11 @@ Handles appointment scheduling, conflict detection, and status management.
 
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
+from sqlalchemy import select, func
 from database.db_manager import DatabaseManagement
 from models.appointment import Appointment
+from models.appointment_extra import appointment_extra_association
+from models.extra import Extra
 from models.service import Service
 from models.customer import Customer
 from services.financial_service import FinancialService
@@ -32,7 +35,8 @@ class AppointmentService:
     
     def create_appointment(self, customer_id: int, service_id: int, 
                           appointment_datetime: datetime,
-                          notes: str = None, customer_feeling: str = None) -> Tuple[Optional[Appointment], str]:
+                          notes: str = None, customer_feeling: str = None,
+                          extras: List = None) -> Tuple[Optional[Appointment], str]:
         """
         Create a new appointment with conflict checking.
         
@@ -42,6 +46,7 @@ class AppointmentService:
             appointment_datetime: Scheduled date and time
             notes: Optional notes
             customer_feeling: Optional customer mood/feeling
+            extras: Optional list of Extra objects to add to the appointment
             
         Returns:
             Tuple of (Appointment if successful, error message if failed)
@@ -76,6 +81,12 @@ class AppointmentService:
             customer_feeling=customer_feeling
         )
         
+        # Attach extras and their totals so everything is written in one save
+        if extras:
+            appointment.extras = list(extras)
+            appointment.price_paid += sum(extra.price for extra in extras)
+            appointment.duration_minutes += sum(extra.duration_minutes for extra in extras)
+        
         success = self.db_manager.save(appointment)
         if success:
             # Retrieve fresh instance to avoid detached instance issues
@@ -100,12 +111,8 @@ class AppointmentService:
         # Calculate end time
         end_time = appointment_datetime + timedelta(minutes=duration_minutes)
         
-        # Get all scheduled appointments for this service
-        scheduled = self.db_manager.find(
-            Appointment,
-            service_id=service_id,
-            status=Appointment.STATUS_SCHEDULED
-        )
+        # Get the scheduled appointments for this service that could overlap
+        scheduled = self._get_scheduled_near(service_id, appointment_datetime, end_time)
         
         for existing in scheduled:
             if existing.id == getattr(self, '_current_appointment_id', None):
@@ -119,6 +126,28 @@ class AppointmentService:
         
         return None
     
+    def _get_scheduled_near(self, service_id: int, start: datetime, end: datetime) -> List[Appointment]:
+        """
+        Get scheduled appointments for a service that could overlap [start, end).
+        
+        Only appointments starting no earlier than the longest scheduled duration
+        before start are loaded, ordered by start time.
+        """
+        longest = self.db_manager.execute_query(lambda session: session.scalar(
+            select(func.max(Appointment.duration_minutes)).where(
+                Appointment.service_id == service_id,
+                Appointment.status == Appointment.STATUS_SCHEDULED
+            )
+        ))
+        if longest is None:
+            return []
+        
+        return self.db_manager.find_in_range(
+            Appointment, "appointment_datetime",
+            start - timedelta(minutes=longest), end,
+            service_id=service_id, status=Appointment.STATUS_SCHEDULED
+        )
+    
     def cancel_appointment(self, appointment_id: int, reason: str = None) -> Tuple[bool, str]:
         """
         Cancel an appointment.
@@ -216,24 +245,14 @@ class AppointmentService:
         if not service or not service.is_available:
             return []
         
-        # Get all scheduled appointments for this service on this date
-        scheduled = self.db_manager.find(
-            Appointment,
-            service_id=service_id,
-            status=Appointment.STATUS_SCHEDULED
-        )
-        
-        # Filter to appointments on the target date
-        date_appointments = [
-            apt for apt in scheduled
-            if apt.appointment_datetime.date() == date
-        ]
-        
         # Generate time slots (every 30 minutes)
         available_slots = []
         current_time = datetime.combine(date, datetime.min.time().replace(hour=start_hour))
         end_time = datetime.combine(date, datetime.min.time().replace(hour=end_hour))
         
+        # Get the scheduled appointments that could overlap the opening hours
+        date_appointments = self._get_scheduled_near(service_id, current_time, end_time)
+        
         slot_duration = timedelta(minutes=30)
         
         while current_time + timedelta(minutes=service.duration_minutes) <= end_time:
@@ -395,13 +414,21 @@ class AppointmentService:
         """Get all appointments for a service."""
         return self.db_manager.find(Appointment, service_id=service_id)
     
-    def get_appointments_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Appointment]:
-        """Get appointments within a date range."""
-        all_appointments = self.db_manager.get_all(Appointment)
-        return [
-            apt for apt in all_appointments
-            if start_date <= apt.appointment_datetime <= end_date
-        ]
+    def get_appointments_by_date_range(self, start_date: datetime, end_date: datetime,
+                                       status: str = None) -> List[Appointment]:
+        """Get appointments within a date range, optionally with one status, ordered by time."""
+        filters = {"status": status} if status is not None else {}
+        return self.db_manager.find_in_range(
+            Appointment, "appointment_datetime", start_date, end_date, **filters
+        )
+    
+    def get_appointment_extras(self, appointment_id: int) -> List[Extra]:
+        """Get the extras booked on an appointment without loading the appointment."""
+        statement = select(Extra).join(
+            appointment_extra_association,
+            appointment_extra_association.c.extra_id == Extra.id
+        ).where(appointment_extra_association.c.appointment_id == appointment_id)
+        return self.db_manager.execute_query(lambda session: list(session.scalars(statement)))
     
     def get_appointments_by_status(self, status: str) -> List[Appointment]:
         """Get appointments by status."""
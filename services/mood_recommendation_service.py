@@ -18,6 +18,9 @@ class MoodRecommendationService:
     Creates a link: Feeling → Service → Extras
     """
     
+    # Bumped by notify_data_changed(); instances drop memoized lookups older than this
+    _data_version = 0
+    
     # Feeling categories and their service matches
     FEELING_SERVICE_MAP = {
         "stressed": {
@@ -104,6 +107,31 @@ class MoodRecommendationService:
             db_manager: DatabaseManagement instance
         """
         self.db_manager = db_manager
+        
+        # Memoized lookups; dropped by clear_cache() or once any window reports
+        # changed mappings or services through notify_data_changed()
+        self._feelings_cache: Optional[List[str]] = None
+        self._recommendations_cache: Dict[str, Dict] = {}
+        self._cache_version = MoodRecommendationService._data_version
+    
+    @staticmethod
+    def notify_data_changed():
+        """
+        Report that feeling mappings or services were changed.
+        Every instance re-reads the database on its next lookup.
+        """
+        MoodRecommendationService._data_version += 1
+    
+    def clear_cache(self):
+        """Forget memoized feelings and recommendations so they are re-read from the database."""
+        self._feelings_cache = None
+        self._recommendations_cache.clear()
+        self._cache_version = MoodRecommendationService._data_version
+    
+    def _check_cache(self):
+        """Drop memoized lookups made before the last reported data change."""
+        if self._cache_version != MoodRecommendationService._data_version:
+            self.clear_cache()
     
     def get_recommendations_by_feeling(self, feeling: str, customer_id: Optional[int] = None) -> Dict:
         """
@@ -119,7 +147,21 @@ class MoodRecommendationService:
                 - services: List of recommended services
                 - extras_by_service: Dict mapping service_id to list of extras
                 - description: Why these recommendations
+            
+            Results are memoized per feeling; treat the returned dictionary as read-only.
         """
+        self._check_cache()
+        cache_key = feeling.lower().strip()
+        cached = self._recommendations_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        recommendations = self._build_recommendations(feeling)
+        self._recommendations_cache[cache_key] = recommendations
+        return recommendations
+    
+    def _build_recommendations(self, feeling: str) -> Dict:
+        """Build the recommendation dictionary for a feeling from the database."""
         feeling_lower = feeling.lower().strip()
         
         # First, try to get mappings from database
@@ -284,6 +326,10 @@ class MoodRecommendationService:
         Returns:
             List of feeling strings
         """
+        self._check_cache()
+        if self._feelings_cache is not None:
+            return list(self._feelings_cache)
+        
         # Get feelings from database mappings
         db_mappings = self.db_manager.get_all(FeelingServiceMapping)
         db_feelings = set(m.feeling for m in db_mappings)
@@ -292,7 +338,8 @@ class MoodRecommendationService:
         all_feelings = set(self.FEELING_SERVICE_MAP.keys()) | db_feelings
         
         # Return sorted list
-        return sorted(list(all_feelings))
+        self._feelings_cache = sorted(all_feelings)
+        return list(self._feelings_cache)
     
     def get_extras_for_service_and_feeling(self, service_id: int, feeling: str) -> List[Extra]:
         """
@@ -9,6 +9,7 @@ from database.db_manager import DatabaseManagement
 from models.appointment import Appointment
 from models.customer import Customer
 from models.service import Service
+from models.extra import Extra
 from services.appointment_service import AppointmentService
 
 
@@ -99,6 +100,42 @@ class TestAppointment:
         assert retrieved.service_id == sample_service.id
         assert retrieved.status == Appointment.STATUS_SCHEDULED
     
+    def test_appointment_service_create_with_extras(self, db_manager, appointment_service,
+                                                    sample_customer, sample_service):
+        """Test creating an appointment with extras in a single save."""
+        stones = db_manager.create(Extra, name="Hot Stones", price=10.0, duration_minutes=15)
+        tea = db_manager.create(Extra, name="Premium Tea", price=5.0, duration_minutes=0)
+        
+        appointment, error = appointment_service.create_appointment(
+            sample_customer.id,
+            sample_service.id,
+            datetime.now() + timedelta(days=1),
+            extras=[stones, tea]
+        )
+        
+        assert error is None
+        assert appointment.price_paid == sample_service.price + 15.0
+        assert appointment.duration_minutes == sample_service.duration_minutes + 15
+        with db_manager.unit_of_work() as session:
+            stored = session.get(Appointment, appointment.id)
+            assert {e.name for e in stored.extras} == {"Hot Stones", "Premium Tea"}
+    
+    def test_get_appointment_extras(self, appointment_service, db_manager, sample_customer, sample_service):
+        """Test fetching an appointment's extras by appointment id."""
+        extras = [
+            db_manager.create(Extra, name="Hot Stones", price=10.0, duration_minutes=10),
+            db_manager.create(Extra, name="Premium Tea", price=5.0, duration_minutes=5),
+        ]
+        with_extras, _ = appointment_service.create_appointment(
+            sample_customer.id, sample_service.id, datetime.now() + timedelta(days=1), extras=extras[:1]
+        )
+        without_extras, _ = appointment_service.create_appointment(
+            sample_customer.id, sample_service.id, datetime.now() + timedelta(days=2)
+        )
+        
+        assert [e.name for e in appointment_service.get_appointment_extras(with_extras.id)] == ["Hot Stones"]
+        assert appointment_service.get_appointment_extras(without_extras.id) == []
+    
     def test_appointment_service_conflict_detection(self, appointment_service, sample_customer, sample_service):
         """Test conflict detection."""
         appointment_time = datetime.now() + timedelta(days=1)
@@ -123,6 +160,20 @@ class TestAppointment:
         assert error is not None
         assert "conflict" in error.lower()
     
+    def test_check_conflict_boundaries(self, appointment_service, sample_customer, sample_service):
+        """Test that only genuinely overlapping scheduled appointments conflict."""
+        start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+        duration = timedelta(minutes=sample_service.duration_minutes)
+        appointment, _ = appointment_service.create_appointment(sample_customer.id, sample_service.id, start)
+        
+        assert appointment_service.check_conflict(sample_service.id, start + duration - timedelta(minutes=1), 30)
+        assert appointment_service.check_conflict(sample_service.id, start - timedelta(minutes=10), 15)
+        assert appointment_service.check_conflict(sample_service.id, start + duration, 30) is None
+        assert appointment_service.check_conflict(sample_service.id, start - timedelta(minutes=30), 30) is None
+        
+        appointment_service.cancel_appointment(appointment.id)
+        assert appointment_service.check_conflict(sample_service.id, start, 30) is None
+    
     def test_appointment_cancel(self, appointment_service, sample_customer, sample_service):
         """Test cancelling an appointment."""
         appointment_time = datetime.now() + timedelta(days=1)
@@ -222,6 +273,23 @@ class TestAppointment:
         assert any(apt.id == apt1.id for apt in appointments)
         assert any(apt.id == apt2.id for apt in appointments)
     
+    def test_get_appointments_by_date_range(self, appointment_service, sample_customer, sample_service):
+        """Test date-range queries with and without a status filter."""
+        start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+        for days in (0, 2, 5):
+            appointment_service.create_appointment(
+                sample_customer.id, sample_service.id, start + timedelta(days=days)
+            )
+        
+        in_range = appointment_service.get_appointments_by_date_range(start, start + timedelta(days=2))
+        assert [a.appointment_datetime for a in in_range] == [start, start + timedelta(days=2)]
+        
+        appointment_service.cancel_appointment(in_range[0].id)
+        scheduled = appointment_service.get_appointments_by_date_range(
+            start, start + timedelta(days=5), status=Appointment.STATUS_SCHEDULED
+        )
+        assert len(scheduled) == 2
+    
     def test_get_appointments_by_status(self, appointment_service, sample_customer, sample_service):
         """Test getting appointments by status."""
         time1 = datetime.now() + timedelta(days=1)
@@ -269,6 +337,21 @@ class TestAppointment:
         assert 'id' in appointment_dict
         assert 'appointment_datetime' in appointment_dict
     
+    def test_delete_appointment_with_extras(self, db_manager, appointment_service,
+                                            sample_customer, sample_service):
+        """Test deleting an appointment also clears its extras links."""
+        extra = db_manager.create(Extra, name="Hot Stones", price=10.0)
+        appointment, _ = appointment_service.create_appointment(
+            sample_customer.id, sample_service.id, datetime.now() + timedelta(days=1)
+        )
+        appointment_service.update_appointment(appointment.id, extras=[extra])
+        with db_manager.unit_of_work() as session:
+            assert len(session.get(Appointment, appointment.id).extras) == 1
+        
+        assert db_manager.delete(appointment) is True
+        assert db_manager.get_by_id(Appointment, appointment.id) is None
+        assert db_manager.get_by_id(Extra, extra.id) is not None
+    
     def test_appointment_status_constants(self):
         """Test appointment status constants."""
         assert Appointment.STATUS_SCHEDULED == "scheduled"
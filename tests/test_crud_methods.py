@@ -4,7 +4,7 @@ Tests for CRUD convenience methods in DatabaseManagement.
 
 import os
 import pytest
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, event
 from database.db_manager import DatabaseManagement
 from database.base import Base
 
@@ -57,6 +57,15 @@ class TestCRUDMethods:
         assert retrieved is not None
         assert retrieved.name == "Test1"
     
+    def test_attributes_loaded_after_save(self, db_manager):
+        """Test that saved objects keep their values after commit."""
+        obj = TestModel(name="Loaded", value="StillHere")
+        assert db_manager.save(obj) is True
+        
+        # Attributes are not expired on commit, so no reload is needed
+        assert obj.name == "Loaded"
+        assert obj.value == "StillHere"
+    
     def test_create(self, db_manager):
         """Test create method."""
         obj = db_manager.create(TestModel, name="Test2", value="Value2")
@@ -85,6 +94,16 @@ class TestCRUDMethods:
         assert updated.name == "Updated"
         assert updated.value == "UpdatedValue"
     
+    def test_update_invalid_attribute(self, db_manager):
+        """Test update rejects unknown attributes and leaves the row unchanged."""
+        obj = db_manager.create(TestModel, name="Keep", value="Same")
+        
+        success = db_manager.update(obj, value="Changed", missing_field="x")
+        
+        assert success is False
+        assert obj.value == "Same"
+        assert db_manager.get_by_id(TestModel, obj.id).value == "Same"
+    
     def test_delete(self, db_manager):
         """Test delete method."""
         # Create an object
@@ -117,6 +136,36 @@ class TestCRUDMethods:
         # Test non-existent ID
         assert db_manager.get_by_id(TestModel, 99999) is None
     
+    def test_get_by_ids(self, db_manager):
+        """Test get_by_ids fetches several objects keyed by id."""
+        first = db_manager.create(TestModel, name="First", value="1")
+        second = db_manager.create(TestModel, name="Second", value="2")
+        
+        found = db_manager.get_by_ids(TestModel, [second.id, first.id, second.id, 99999])
+        
+        assert set(found) == {first.id, second.id}
+        assert found[second.id].name == "Second"
+        assert db_manager.get_by_ids(TestModel, []) == {}
+    
+    def test_get_by_id_identity_map(self, db_manager):
+        """Test repeated get_by_id in one session issues a single SELECT."""
+        obj = db_manager.create(TestModel, name="Cached", value="Once")
+        statements = []
+        
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(db_manager.engine, "before_cursor_execute", count_statements)
+        try:
+            with db_manager.unit_of_work() as session:
+                first = db_manager.get_by_id(TestModel, obj.id, session=session)
+                second = db_manager.get_by_id(TestModel, obj.id, session=session)
+        finally:
+            event.remove(db_manager.engine, "before_cursor_execute", count_statements)
+        
+        assert first is second
+        assert len([s for s in statements if s.startswith("SELECT")]) == 1
+    
     def test_get_all(self, db_manager):
         """Test get_all method."""
         # Create multiple objects
@@ -146,6 +195,83 @@ class TestCRUDMethods:
         assert len(results) == 2
         assert all(obj.value == "Target" for obj in results)
     
+    def test_find_with_none_filter(self, db_manager):
+        """Test that None filter values match NULL columns."""
+        db_manager.create(TestModel, name="NoValue")
+        db_manager.create(TestModel, name="HasValue", value="Set")
+        
+        results = db_manager.find(TestModel, value=None)
+        
+        assert [obj.name for obj in results] == ["NoValue"]
+        assert db_manager.count(TestModel, value=None) == 1
+        assert db_manager.find_one(TestModel, name="HasValue", value=None) is None
+    
+    def test_get_all_ordered(self, db_manager):
+        """Test get_all with SQL ordering and primary key tie-break."""
+        second = db_manager.create(TestModel, name="B", value="2")
+        first = db_manager.create(TestModel, name="A", value="1")
+        tied = db_manager.create(TestModel, name="B", value="3")
+        
+        ascending = db_manager.get_all(TestModel, order_by="name")
+        assert [obj.id for obj in ascending] == [first.id, second.id, tied.id]
+        
+        descending = db_manager.get_all(TestModel, order_by="name", descending=True)
+        assert [obj.id for obj in descending] == [second.id, tied.id, first.id]
+        
+        by_name_value = db_manager.get_all(TestModel, order_by=("name", "value"), descending=True)
+        assert [obj.id for obj in by_name_value] == [tied.id, second.id, first.id]
+    
+    def test_find_in_range(self, db_manager):
+        """Test find_in_range with bounds and equality filters."""
+        for name in ("Apple", "Banana", "Cherry", "Damson"):
+            db_manager.create(TestModel, name=name, value="Fruit")
+        db_manager.create(TestModel, name="Carrot", value="Vegetable")
+        
+        results = db_manager.find_in_range(TestModel, "name", "Banana", "Cherry")
+        assert [obj.name for obj in results] == ["Banana", "Carrot", "Cherry"]
+        
+        fruit = db_manager.find_in_range(TestModel, "name", "Banana", "Damson", value="Fruit")
+        assert [obj.name for obj in fruit] == ["Banana", "Cherry", "Damson"]
+    
+    def test_get_columns(self, db_manager):
+        """Test get_columns returns value tuples in primary key order."""
+        first = db_manager.create(TestModel, name="First", value="1")
+        second = db_manager.create(TestModel, name="Second", value=None)
+        
+        rows = db_manager.get_columns(TestModel, ("id", "name", "value"))
+        
+        assert rows == [(first.id, "First", "1"), (second.id, "Second", None)]
+        assert db_manager.get_columns(TestModel, ["name"]) == [("First",), ("Second",)]
+    
+    def test_search(self, db_manager):
+        """Test search matches text case-insensitively across fields."""
+        db_manager.create(TestModel, name="Bamboo Bear", value="Forest")
+        db_manager.create(TestModel, name="River Otter", value="bamboo grove")
+        db_manager.create(TestModel, name="100% Fox", value="Forest")
+        db_manager.create(TestModel, name="Deer", value=None)
+        
+        results = db_manager.search(TestModel, ("name", "value"), "BAMBOO")
+        assert [obj.name for obj in results] == ["Bamboo Bear", "River Otter"]
+        
+        forest = db_manager.search(TestModel, ("name", "value"), "bamboo", value="Forest")
+        assert [obj.name for obj in forest] == ["Bamboo Bear"]
+        
+        # LIKE wildcards in the search text match literally
+        assert [obj.name for obj in db_manager.search(TestModel, ("name",), "0%")] == ["100% Fox"]
+        assert db_manager.search(TestModel, ("name",), "_") == []
+    
+    def test_iter_all_and_iter_find(self, db_manager):
+        """Test streaming iter_all and iter_find methods."""
+        db_manager.create(TestModel, name="Stream1", value="Streamed")
+        db_manager.create(TestModel, name="Stream2", value="Streamed")
+        db_manager.create(TestModel, name="Stream3", value="Other")
+        
+        names = {obj.name for obj in db_manager.iter_all(TestModel)}
+        assert {"Stream1", "Stream2", "Stream3"} <= names
+        
+        streamed = list(db_manager.iter_find(TestModel, value="Streamed"))
+        assert sorted(obj.name for obj in streamed) == ["Stream1", "Stream2"]
+    
     def test_find_one(self, db_manager):
         """Test find_one method."""
         # Create an object
@@ -219,6 +345,30 @@ class TestCRUDMethods:
         finally:
             session.close()
     
+    def test_unit_of_work_commit(self, db_manager):
+        """Test that a unit of work shares one session and commits on exit."""
+        with db_manager.unit_of_work() as session:
+            obj = db_manager.create(TestModel, session=session, name="UoW1", value="Batch")
+            db_manager.save(TestModel(name="UoW2", value="Batch"), session=session)
+            db_manager.update(obj, session=session, value="Updated")
+            
+            # Pending rows are visible inside the same session
+            assert db_manager.count(TestModel, session=session, value="Batch") == 1
+            assert db_manager.exists(TestModel, session=session, name="UoW1") is True
+            assert db_manager.get_by_id(TestModel, obj.id, session=session) is not None
+        
+        assert db_manager.find_one(TestModel, name="UoW1").value == "Updated"
+        assert db_manager.exists(TestModel, name="UoW2") is True
+    
+    def test_unit_of_work_rollback(self, db_manager):
+        """Test that a unit of work rolls back when the block raises."""
+        with pytest.raises(ValueError):
+            with db_manager.unit_of_work() as session:
+                db_manager.create(TestModel, session=session, name="UoWRollback")
+                raise ValueError("abort")
+        
+        assert db_manager.exists(TestModel, name="UoWRollback") is False
+    
     def test_refresh(self, db_manager):
         """Test refresh method."""
         # Create and modify object in another session
@@ -288,4 +438,17 @@ class TestCRUDMethods:
         # Now verify they're gone
         for obj_id in obj_ids:
             assert db_manager.get_by_id(TestModel, obj_id) is None
-
+    
+    def test_bulk_delete_in_batches(self, db_manager):
+        """Test bulk_delete handles more rows than one DELETE batch."""
+        from database.db_manager import DELETE_BATCH_SIZE
+        
+        db_manager.bulk_save([
+            TestModel(name=f"Batch{i}", value="Batched")
+            for i in range(DELETE_BATCH_SIZE + 5)
+        ])
+        objects = db_manager.find(TestModel, value="Batched")
+        assert len(objects) == DELETE_BATCH_SIZE + 5
+        
+        assert db_manager.bulk_delete(objects) is True
+        assert db_manager.count(TestModel, value="Batched") == 0
@@ -4,6 +4,7 @@ Verifies database initialization, connection, and basic operations.
 """
 
 import os
+import sqlite3
 import pytest
 from sqlalchemy import text
 from database.db_manager import DatabaseManagement
@@ -135,6 +136,42 @@ class TestDatabaseManagement:
         )
         assert result == 1
     
+    def test_connection_pragmas(self, db_manager):
+        """Test that SQLite PRAGMAs are applied on connect."""
+        db_manager.initialize_database()
+        
+        journal_mode = db_manager.execute_query(
+            lambda session: session.execute(text("PRAGMA journal_mode")).scalar()
+        )
+        synchronous = db_manager.execute_query(
+            lambda session: session.execute(text("PRAGMA synchronous")).scalar()
+        )
+        
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+    
+    def test_reads_skip_transactions(self, db_manager):
+        """Test that read-only helpers send no BEGIN/COMMIT to SQLite."""
+        from models.customer import Customer
+        db_manager.initialize_database()
+        db_manager.create(Customer, name="Reader", species="Bear")
+        
+        statements = []
+        raw_connection = db_manager.engine.raw_connection()
+        raw_connection.driver_connection.set_trace_callback(statements.append)
+        raw_connection.close()  # Back to the pool for the next checkout
+        try:
+            db_manager.get_by_id(Customer, 1)
+            db_manager.count(Customer)
+            db_manager.exists(Customer, species="Bear")
+        finally:
+            raw_connection = db_manager.engine.raw_connection()
+            raw_connection.driver_connection.set_trace_callback(None)
+            raw_connection.close()
+        
+        assert len(statements) == 3
+        assert all(statement.startswith("SELECT") for statement in statements)
+    
     def test_drop_tables(self, db_manager):
         """Test table dropping."""
         db_manager.initialize_database()
@@ -183,7 +220,18 @@ class TestDatabaseManagement:
             db_manager.backup_database(backup_path)
             
             assert os.path.exists(backup_path)
-            assert os.path.getsize(backup_path) == os.path.getsize(test_db_path)
+            
+            # Backup is a consistent snapshot containing the same tables
+            backup_conn = sqlite3.connect(backup_path)
+            try:
+                backup_tables = {
+                    row[0] for row in backup_conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type='table'"
+                    )
+                }
+            finally:
+                backup_conn.close()
+            assert backup_tables == set(db_manager.get_database_info()["tables"])
         finally:
             if os.path.exists(backup_path):
                 os.remove(backup_path)
@@ -225,6 +273,16 @@ class TestDatabaseManagement:
         session1.close()
         session2.close()
     
+    def test_crud_session_reused(self, db_manager):
+        """Test that convenience methods share one thread-local session."""
+        db_manager.initialize_database()
+        
+        assert db_manager._session() is db_manager._session()
+        assert db_manager._session() is not db_manager.get_session()
+        
+        db_manager.close()
+        assert db_manager._scoped_session is None
+    
     def test_uninitialized_operations(self, db_manager):
         """Test that operations fail gracefully when database is not initialized."""
         # These should raise RuntimeError
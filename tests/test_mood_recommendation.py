@@ -0,0 +1,91 @@
+"""
+Tests for MoodRecommendationService.
+Verifies feeling lookups and memoized recommendations.
+"""
+
+import os
+import pytest
+from database.db_manager import DatabaseManagement
+from models.service import Service
+from models.feeling_service_mapping import FeelingServiceMapping
+from services.mood_recommendation_service import MoodRecommendationService
+
+
+class TestMoodRecommendationService:
+    """Test suite for MoodRecommendationService."""
+    
+    @pytest.fixture
+    def test_db_path(self):
+        """Provide a test database path."""
+        return "test_mood_panda_spa.db"
+    
+    @pytest.fixture
+    def db_manager(self, test_db_path):
+        """Create a DatabaseManagement instance for testing."""
+        manager = DatabaseManagement(db_path=test_db_path)
+        manager.initialize_database()
+        yield manager
+        # Cleanup
+        manager.close()
+        if os.path.exists(test_db_path):
+            os.remove(test_db_path)
+    
+    @pytest.fixture
+    def mood_service(self, db_manager):
+        """Create a MoodRecommendationService with one mapped service."""
+        service = db_manager.create(
+            Service,
+            name="Bamboo Massage",
+            service_type=Service.MASSAGE,
+            duration_minutes=45,
+            price=40.0
+        )
+        db_manager.create(FeelingServiceMapping, feeling="grumpy", service_id=service.id, priority=1)
+        return MoodRecommendationService(db_manager)
+    
+    def test_available_feelings_include_mappings(self, mood_service):
+        """Test that database feelings are merged with built-in ones."""
+        feelings = mood_service.get_available_feelings()
+        
+        assert "grumpy" in feelings
+        assert "stressed" in feelings
+        assert feelings == sorted(feelings)
+    
+    def test_recommendations_cached_until_cleared(self, mood_service, db_manager):
+        """Test that recommendations are memoized and refreshed by clear_cache."""
+        first = mood_service.get_recommendations_by_feeling("grumpy")
+        assert [s.name for s in first["services"]] == ["Bamboo Massage"]
+        assert mood_service.get_recommendations_by_feeling(" Grumpy ") is first
+        assert "sleepy" not in mood_service.get_available_feelings()
+        
+        other = db_manager.create(
+            Service,
+            name="Mud Bath",
+            service_type=Service.THERMAL_BATH,
+            duration_minutes=30,
+            price=25.0
+        )
+        db_manager.create(FeelingServiceMapping, feeling="grumpy", service_id=other.id, priority=2)
+        db_manager.create(FeelingServiceMapping, feeling="sleepy", service_id=other.id, priority=1)
+        assert mood_service.get_recommendations_by_feeling("grumpy") is first
+        assert "sleepy" not in mood_service.get_available_feelings()
+        
+        mood_service.clear_cache()
+        
+        refreshed = mood_service.get_recommendations_by_feeling("grumpy")
+        assert [s.name for s in refreshed["services"]] == ["Bamboo Massage", "Mud Bath"]
+        assert "sleepy" in mood_service.get_available_feelings()
+    
+    def test_cache_dropped_on_data_change(self, mood_service, db_manager):
+        """Test that notify_data_changed refreshes every instance's memoized lookups."""
+        other_instance = MoodRecommendationService(db_manager)
+        first = mood_service.get_recommendations_by_feeling("grumpy", customer_id=1)
+        assert mood_service.get_recommendations_by_feeling("grumpy", customer_id=2) is first
+        assert "sleepy" not in other_instance.get_available_feelings()
+        
+        service = db_manager.get_by_id(Service, 1)
+        db_manager.create(FeelingServiceMapping, feeling="sleepy", service_id=service.id, priority=1)
+        MoodRecommendationService.notify_data_changed()
+        
+        assert mood_service.get_recommendations_by_feeling("grumpy") is not first
+        assert "sleepy" in other_instance.get_available_feelings()